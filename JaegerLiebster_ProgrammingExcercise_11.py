@@ -1,19 +1,157 @@
+import argparse
+import math
+import os
 import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations, combinations_with_replacement
+
+import numpy as np
+
+RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "Jack", "Queen", "King", "Ace"]
+SUITS = ["Hearts", "Diamonds", "Clubs", "Spades"]
+RANK_INDEX = {rank: i for i, rank in enumerate(RANKS)}
+SUIT_INDEX = {suit: i for i, suit in enumerate(SUITS)}
+
+def card_code(rank, suit):
+    # Packs a card into one small int (0-51): rank index * 4 + suit index
+    return RANK_INDEX[rank] * 4 + SUIT_INDEX[suit]
 
 class Card:
-    # Represents a card
+    # Represents a card, code is its small int form used by the hand evaluator
+    __slots__ = ("rank", "suit", "code")
+
     def __init__(self, rank, suit):
         self.rank = rank
         self.suit = suit
+        self.code = card_code(rank, suit)
+
+    @classmethod
+    def from_code(cls, code):
+        # Builds a card back from its int code
+        return cls(RANKS[code >> 2], SUITS[code & 3])
 
     def __str__(self):
         # Prints a label for the card
         return f"{self.rank} of {self.suit}"
 
+# Hand categories, weakest first, the category is the leading digit of a hand value in base 13
+HAND_NAMES = ["High Card", "Pair", "Two Pair", "Three of a Kind", "Straight",
+              "Flush", "Full House", "Four of a Kind", "Straight Flush"]
+HIGH_CARD, PAIR, TWO_PAIR, THREE_OF_A_KIND, STRAIGHT, FLUSH, FULL_HOUSE, FOUR_OF_A_KIND, STRAIGHT_FLUSH = range(9)
+
+# One prime per rank, the product of a hand's primes identifies its ranks regardless of order
+RANK_PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+
+# Per card code lookups so evaluating a hand never has to split a code apart
+CARD_PRIME = [RANK_PRIMES[code >> 2] for code in range(52)]
+CARD_BIT = [1 << (code >> 2) for code in range(52)]
+CARD_SUIT = [code & 3 for code in range(52)]
+
+def _hand_value(category, ranks):
+    # Packs a category and tie-break ranks (most important first) into one comparable int
+    value = category
+    for rank in ranks:
+        value = value * 13 + rank
+    for _ in range(5 - len(ranks)):
+        value *= 13
+    return value
+
+def _straight_high(distinct_ranks):
+    # Top rank of a straight made by 5 distinct ranks (sorted high to low), or None
+    if distinct_ranks[0] - distinct_ranks[4] == 4:
+        return distinct_ranks[0]
+    if distinct_ranks == [12, 3, 2, 1, 0]:
+        return 3  # A-2-3-4-5, the five is the high card
+    return None
+
+def _rank_multiset_value(ranks):
+    # Value of a non-flush hand from its 5 ranks, used only to fill the lookup tables
+    counts = {}
+    for rank in ranks:
+        counts[rank] = counts.get(rank, 0) + 1
+    # group by count then rank, e.g. full house kings over fives -> [(3, 11), (2, 3)]
+    groups = sorted(((count, rank) for rank, count in counts.items()), reverse=True)
+    shape = [count for count, _ in groups]
+    ordered = [rank for _, rank in groups]
+
+    if shape == [1, 1, 1, 1, 1]:
+        high = _straight_high(ordered)
+        if high is not None:
+            return _hand_value(STRAIGHT, [high])
+        return _hand_value(HIGH_CARD, ordered)
+    category = {
+        (2, 1, 1, 1): PAIR, (2, 2, 1): TWO_PAIR, (3, 1, 1): THREE_OF_A_KIND,
+        (3, 2): FULL_HOUSE, (4, 1): FOUR_OF_A_KIND,
+    }[tuple(shape)]
+    return _hand_value(category, ordered)
+
+def _build_tables():
+    # Precomputes every 5-card value: flushes by rank bitmask, everything else by prime product
+    flush_table = [0] * (1 << 13)
+    for ranks in combinations(range(12, -1, -1), 5):
+        high = _straight_high(list(ranks))
+        mask = sum(1 << rank for rank in ranks)
+        if high is not None:
+            flush_table[mask] = _hand_value(STRAIGHT_FLUSH, [high])
+        else:
+            flush_table[mask] = _hand_value(FLUSH, list(ranks))
+
+    product_table = {}
+    for ranks in combinations_with_replacement(range(13), 5):
+        if ranks[0] == ranks[4]:
+            continue  # five of a kind is impossible with one deck
+        product = 1
+        for rank in ranks:
+            product *= RANK_PRIMES[rank]
+        product_table[product] = _rank_multiset_value(ranks)
+    return flush_table, product_table
+
+FLUSH_TABLE, PRODUCT_TABLE = _build_tables()
+
+# Sorted arrays of the product table for the NumPy batch evaluator
+PRODUCT_KEYS = np.array(sorted(PRODUCT_TABLE), dtype=np.int64)
+PRODUCT_VALUES = np.array([PRODUCT_TABLE[key] for key in PRODUCT_KEYS.tolist()], dtype=np.int64)
+FLUSH_VALUES = np.array(FLUSH_TABLE, dtype=np.int64)
+CARD_PRIME_ARRAY = np.array(CARD_PRIME, dtype=np.int64)
+CARD_BIT_ARRAY = np.array(CARD_BIT, dtype=np.int64)
+CARD_SUIT_ARRAY = np.array(CARD_SUIT, dtype=np.int64)
+
+def evaluate_hand(c0, c1, c2, c3, c4):
+    # Value of a 5-card hand given as int codes, higher is better, two table lookups at most
+    suit = CARD_SUIT[c0]
+    if CARD_SUIT[c1] == suit and CARD_SUIT[c2] == suit and CARD_SUIT[c3] == suit and CARD_SUIT[c4] == suit:
+        return FLUSH_TABLE[CARD_BIT[c0] | CARD_BIT[c1] | CARD_BIT[c2] | CARD_BIT[c3] | CARD_BIT[c4]]
+    return PRODUCT_TABLE[CARD_PRIME[c0] * CARD_PRIME[c1] * CARD_PRIME[c2] * CARD_PRIME[c3] * CARD_PRIME[c4]]
+
+def evaluate_cards(cards):
+    # Value of a hand of 5 Card objects or int codes
+    codes = [card if isinstance(card, int) else card.code for card in cards]
+    return evaluate_hand(*codes)
+
+def evaluate_hands(hands):
+    # Values of many hands at once, hands is an (N, 5) array of int codes
+    hands = np.asarray(hands, dtype=np.int64)
+    suits = CARD_SUIT_ARRAY[hands]
+    is_flush = (suits == suits[:, :1]).all(axis=1)
+    masks = np.bitwise_or.reduce(CARD_BIT_ARRAY[hands], axis=1)
+    products = np.prod(CARD_PRIME_ARRAY[hands], axis=1)
+    values = PRODUCT_VALUES[np.searchsorted(PRODUCT_KEYS, products)]
+    values[is_flush] = FLUSH_VALUES[masks[is_flush]]
+    return values
+
+def hand_category(value):
+    # Category index (HIGH_CARD..STRAIGHT_FLUSH) of a hand value, works on ints and NumPy arrays
+    return value // 13 ** 5
+
+def hand_name(value):
+    # Display name of a hand value, e.g. "Two Pair"
+    return HAND_NAMES[hand_category(value)]
+
 class Deck:
     # Represents the deck
-    RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "Jack", "Queen", "King", "Ace"]
-    SUITS = ["Hearts", "Diamonds", "Clubs", "Spades"]
+    RANKS = RANKS
+    SUITS = SUITS
     def __init__(self):
         # Builds the deck
         self.cards = []
@@ -21,10 +159,11 @@ class Deck:
             for rank in self.RANKS:
                 self.cards.append(Card(rank, suit))
 
-    def shuffle(self):
-        #Shuffles deck
-        random.shuffle(self.cards)
-        print("Deck has been shuffled.")
+    def shuffle(self, rng=None, announce=True):
+        #Shuffles deck, rng is an optional random.Random for repeatable games, announce=False keeps it quiet
+        (rng or random).shuffle(self.cards)
+        if announce:
+            print("Deck has been shuffled.")
 
     def deal_card(self):
         # Deals a card returns none if no cards left in deck
@@ -33,6 +172,65 @@ class Deck:
         else:
             return None
 
+# One Card object per code, shared by every ReusableDeck so dealing never creates cards
+CARDS_BY_CODE = tuple(Card.from_code(code) for code in range(52))
+
+class ReusableDeck:
+    # Deck for simulation loops: the 52 card codes are allocated once and never rebuilt
+    # The shuffle is done lazily, each deal swaps a random remaining card to the top (Fisher-Yates one step
+    # at a time), so reset() is free and dealing 10 cards costs 10 swaps instead of a full 52 card shuffle
+    # deal_card() works like Deck.deal_card, deal(n) hands out a batch of codes
+    def __init__(self, rng=None):
+        self.rng = rng or random.Random()
+        self.order = list(range(52))
+        self.top = 52
+
+    def reset(self):
+        # Puts every card back, the remaining order is re-permuted as cards are dealt
+        self.top = 52
+
+    def shuffle(self, rng=None, announce=False):
+        # Same call as Deck.shuffle, quiet by default since this deck is meant for headless loops
+        if rng is not None:
+            self.rng = rng
+        self.reset()
+        if announce:
+            print("Deck has been shuffled.")
+
+    def __len__(self):
+        return self.top
+
+    def deal(self, n):
+        # Deals up to n card codes from the top
+        order = self.order
+        random_fraction = self.rng.random
+        top = self.top
+        dealt = []
+        for _ in range(min(n, top)):
+            pick = int(random_fraction() * top)
+            top -= 1
+            order[pick], order[top] = order[top], order[pick]
+            dealt.append(order[top])
+        self.top = top
+        return dealt
+
+    def deal_cards(self, n):
+        # Same as deal but returns the shared Card objects
+        return [CARDS_BY_CODE[code] for code in self.deal(n)]
+
+    def deal_card(self):
+        # Deals a card returns none if no cards left in deck
+        if self.top > 0:
+            return CARDS_BY_CODE[self.deal(1)[0]]
+        return None
+
+def deal_many_decks(num_decks, cards_per_deck=52, rng=None):
+    # Shuffles num_decks decks at once and returns the first cards_per_deck codes of each,
+    # as a (num_decks, cards_per_deck) int8 array, rng is a numpy.random.Generator
+    rng = rng if rng is not None else np.random.default_rng()
+    decks = np.broadcast_to(np.arange(52, dtype=np.int8), (num_decks, 52))
+    return rng.permuted(decks, axis=1)[:, :cards_per_deck]
+
 def get_cards_to_replace(hand_size):
     #Prompt user on which card to replace
     indices_to_replace = []
@@ -87,6 +285,142 @@ def get_cards_to_replace(hand_size):
         if is_valid:
             return sorted(indices_to_replace)  # Return the list of 0-based indices
 
+# Discard strategies for the simulator: each takes the 5 card codes of a hand and returns the sorted
+# 0-based indices to replace, the same thing get_cards_to_replace returns for a human player
+def stand_pat(hand):
+    # Keeps every card
+    return []
+
+def draw_five(hand):
+    # Replaces the whole hand
+    return [0, 1, 2, 3, 4]
+
+def keep_pairs(hand):
+    # Keeps cards whose rank appears more than once, keeps everything on a straight or better
+    if evaluate_hand(*hand) >= _hand_value(STRAIGHT, [0]):
+        return []
+    ranks = [code >> 2 for code in hand]
+    return [i for i, rank in enumerate(ranks) if ranks.count(rank) == 1]
+
+def keep_pairs_and_high(hand):
+    # Like keep_pairs, but with no pair keeps Jacks or better instead of drawing five
+    replace = keep_pairs(hand)
+    if len(replace) == 5:
+        replace = [i for i, code in enumerate(hand) if (code >> 2) < RANK_INDEX["Jack"]]
+    return replace
+
+def draw_to_flush(hand):
+    # Keeps four of a suit and draws one, otherwise plays like keep_pairs
+    suits = [code & 3 for code in hand]
+    for suit in set(suits):
+        if suits.count(suit) == 4 and evaluate_hand(*hand) < _hand_value(PAIR, [RANK_INDEX["Jack"]]):
+            return [i for i, card_suit in enumerate(suits) if card_suit != suit]
+    return keep_pairs(hand)
+
+STRATEGIES = {
+    "stand_pat": stand_pat,
+    "draw_five": draw_five,
+    "keep_pairs": keep_pairs,
+    "keep_pairs_and_high": keep_pairs_and_high,
+    "draw_to_flush": draw_to_flush,
+}
+
+DECK_CODES = list(range(52))
+
+def simulate_draws(strategy, trials, seed):
+    # Plays trials headless hands of 5-card draw with one strategy and one random stream
+    # Returns how many final hands landed in each category, plus the sum of hand values
+    strategy = STRATEGIES[strategy] if isinstance(strategy, str) else strategy
+    rng = random.Random(seed)
+    sample = rng.sample
+    counts = [0] * len(HAND_NAMES)
+    value_total = 0
+    for _ in range(trials):
+        # the first 5 cards are the deal and the rest are drawn in order, like popping a shuffled deck
+        cards = sample(DECK_CODES, 10)
+        hand = cards[:5]
+        next_card = 5
+        for index in strategy(hand):
+            hand[index] = cards[next_card]
+            next_card += 1
+        value = evaluate_hand(*hand)
+        counts[value // 13 ** 5] += 1
+        value_total += value
+    return counts, value_total
+
+def _task_seeds(seed, tasks):
+    # Independent, repeatable seeds for each task, derived with NumPy's SeedSequence
+    return [int(child.generate_state(2, dtype=np.uint64)[0]) for child in np.random.SeedSequence(seed).spawn(tasks)]
+
+def run_simulation(strategy, trials, seed=0, workers=None, trials_per_task=100000):
+    # Splits trials into fixed-size tasks with their own RNG streams and runs them across a process pool
+    # The result only depends on seed and trials_per_task, not on how many workers ran it
+    if trials <= 0:
+        raise ValueError("trials must be a positive number of hands")
+    tasks = max(1, math.ceil(trials / trials_per_task))
+    sizes = [trials_per_task] * (tasks - 1) + [trials - trials_per_task * (tasks - 1)]
+    seeds = _task_seeds(seed, tasks)
+    workers = workers or os.cpu_count() or 1
+
+    counts = [0] * len(HAND_NAMES)
+    value_total = 0
+    if workers == 1 or tasks == 1:
+        results = map(simulate_draws, [strategy] * tasks, sizes, seeds)
+        for task_counts, task_total in results:
+            counts = [a + b for a, b in zip(counts, task_counts)]
+            value_total += task_total
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for task_counts, task_total in pool.map(simulate_draws, [strategy] * tasks, sizes, seeds):
+                counts = [a + b for a, b in zip(counts, task_counts)]
+                value_total += task_total
+    return summarize_simulation(strategy, counts, trials, value_total)
+
+def summarize_simulation(strategy, counts, trials, value_total=None, z=1.96):
+    # Turns category counts into probabilities with normal-approximation confidence intervals,
+    # the mean hand category with its own interval and, given the summed hand values, the mean hand value
+    name = strategy if isinstance(strategy, str) else getattr(strategy, "__name__", str(strategy))
+    distribution = []
+    for category, count in enumerate(counts):
+        p = count / trials
+        margin = z * math.sqrt(p * (1 - p) / trials)
+        distribution.append({"hand": HAND_NAMES[category], "count": count, "probability": p,
+                             "low": max(0.0, p - margin), "high": min(1.0, p + margin)})
+    mean = sum(category * count for category, count in enumerate(counts)) / trials
+    variance = sum(count * (category - mean) ** 2 for category, count in enumerate(counts)) / trials
+    margin = z * math.sqrt(variance / trials)
+    summary = {"strategy": name, "trials": trials, "distribution": distribution,
+               "mean_category": mean, "mean_category_low": mean - margin, "mean_category_high": mean + margin}
+    if value_total is not None:
+        # evaluate_hand values order every hand, so their mean is the expected strength including tie-breaks
+        summary["mean_value"] = value_total / trials
+    return summary
+
+def print_simulation(summary):
+    # Prints one strategy's hand distribution as a table
+    print(f"\nStrategy: {summary['strategy']} ({summary['trials']:,} hands)")
+    print(f"{'Hand':<16} {'Probability':>12}   95% interval")
+    for row in summary["distribution"]:
+        print(f"{row['hand']:<16} {row['probability']:>12.6f}   [{row['low']:.6f}, {row['high']:.6f}]")
+    print(f"Mean hand category: {summary['mean_category']:.4f} "
+          f"[{summary['mean_category_low']:.4f}, {summary['mean_category_high']:.4f}]")
+    if "mean_value" in summary:
+        print(f"Mean hand value: {summary['mean_value']:,.0f} (a {hand_name(int(summary['mean_value']))} on average)")
+
+def simulate_main(argv):
+    # Command line entry for the headless simulator
+    parser = argparse.ArgumentParser(description="Monte Carlo 5-card draw discard strategy simulator")
+    parser.add_argument("-n", "--trials", type=int, default=1_000_000, help="hands per strategy")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="base random seed")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--strategy", action="append", choices=list(STRATEGIES), help="strategy (repeatable)")
+    args = parser.parse_args(argv)
+    if args.trials <= 0:
+        parser.error("--trials must be at least 1")
+
+    for strategy in args.strategy or list(STRATEGIES):
+        print_simulation(run_simulation(strategy, args.trials, args.seed, args.workers))
+
 def play_poker_draw():
    #Main function
     print("--- Welcome to 5-Card Draw ---")
@@ -136,9 +470,13 @@ def play_poker_draw():
     print("\nYour final hand:")
     for i, card in enumerate(hand):
         print(f"  {i + 1}: {card}")
+    print(f"Hand: {hand_name(evaluate_cards(hand))}")
 
     print("\n--- Game Over. Good luck! ---")
 
 # Main execution block
 if __name__ == "__main__":
-    play_poker_draw()
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == "--simulate":
+        simulate_main(sys.argv[2:])
+    else:
+        play_poker_draw()
\ No newline at end of file
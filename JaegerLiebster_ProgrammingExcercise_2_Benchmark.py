@@ -0,0 +1,150 @@
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from JaegerLiebster_ProgrammingExcercise_2 import (
+    SPAM_KEYWORDS, KeywordMatcher, compile_keywords, rate_likelihood, scan_message_naive
+)
+
+# filler words for synthetic emails, none of them contain a spam keyword
+FILLER_WORDS = [
+    "meeting", "tomorrow", "please", "review", "the", "attached", "notes", "team", "project",
+    "schedule", "update", "thanks", "regards", "lunch", "report", "budget", "draft", "call",
+    "question", "about", "next", "week", "office", "client", "and", "for", "with", "our"
+]
+
+
+def make_keywords(extra_keywords: int, seed: int) -> List[str]:
+    # the real keyword list plus synthetic ones, to measure how each backend scales with list size
+    rng = random.Random(seed)
+    keywords = list(SPAM_KEYWORDS)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    for _ in range(extra_keywords):
+        keywords.append("".join(rng.choice(letters) for _ in range(rng.randint(6, 14))))
+    return keywords
+
+
+def make_corpus(num_messages: int, message_length: int, keyword_density: float,
+                keywords: List[str], seed: int) -> List[str]:
+    # builds synthetic emails of about message_length characters
+    # keyword_density is the chance that any given word is replaced by a spam keyword
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(num_messages):
+        words = []
+        length = 0
+        while length < message_length:
+            word = rng.choice(keywords) if rng.random() < keyword_density else rng.choice(FILLER_WORDS)
+            words.append(word)
+            length += len(word) + 1
+        corpus.append(" ".join(words))
+    return corpus
+
+
+def get_backends(keywords: List[str]) -> Dict[str, Callable[[str], Tuple[int, List[str]]]]:
+    # name -> scan function, add faster backends here to have them measured alongside the others
+    # matchers are compiled here so build time is not counted as scan time
+    # "auto" is what scan_message uses: str.count below KeywordMatcher.AUTOMATON_MIN_PATTERNS, the automaton above
+    automaton = KeywordMatcher(keywords, use_automaton=True)
+    return {
+        "naive_count": lambda message: scan_message_naive(message, keywords),
+        "aho_corasick": automaton.scan,
+        "auto": compile_keywords(tuple(keywords)).scan,
+    }
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    # nearest-rank percentile of an already sorted list
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def run_backend(scan: Callable[[str], Tuple[int, List[str]]], corpus: List[str]) -> Tuple[dict, List[int]]:
+    # times scan + rate_likelihood per message and returns summary stats plus every score
+    latencies = []
+    scores = []
+    total_bytes = sum(len(message.encode("utf-8")) for message in corpus)
+
+    start = time.perf_counter()
+    for message in corpus:
+        message_start = time.perf_counter_ns()
+        score, _ = scan(message)
+        rate_likelihood(score)
+        latencies.append((time.perf_counter_ns() - message_start) / 1000.0)
+        scores.append(score)
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    result = {
+        "seconds": elapsed,
+        "messages_per_sec": len(corpus) / elapsed if elapsed else 0.0,
+        "mb_per_sec": total_bytes / 1_000_000 / elapsed if elapsed else 0.0,
+        "p50_us": percentile(latencies, 0.50),
+        "p99_us": percentile(latencies, 0.99),
+    }
+    return result, scores
+
+
+def run_benchmark(num_messages: int = 2000, message_length: int = 2000, keyword_density: float = 0.01,
+                  extra_keywords: int = 0, seed: int = 42, backends: Optional[List[str]] = None) -> dict:
+    # generates one corpus and runs every selected backend over it
+    keywords = make_keywords(extra_keywords, seed)
+    corpus = make_corpus(num_messages, message_length, keyword_density, keywords, seed)
+    available = get_backends(keywords)
+    selected = backends or list(available)
+
+    report = {
+        "python": platform.python_version(),
+        "config": {
+            "messages": num_messages,
+            "message_length": message_length,
+            "keyword_density": keyword_density,
+            "keywords": len(keywords),
+            "seed": seed,
+        },
+        "backends": {},
+    }
+
+    reference_scores = None
+    for name in selected:
+        result, scores = run_backend(available[name], corpus)
+        # every backend must score the corpus the same as the first one, which is the reference itself
+        if reference_scores is None:
+            reference_scores = scores
+            result["matches_reference"] = None
+        else:
+            result["matches_reference"] = scores == reference_scores
+        report["backends"][name] = result
+    return report
+
+
+def main(argv: List[str]):
+    # runs the benchmark from the command line and writes a JSON report
+    parser = argparse.ArgumentParser(description="Spam checker throughput benchmark")
+    parser.add_argument("-n", "--messages", type=int, default=2000, help="number of synthetic emails")
+    parser.add_argument("-l", "--length", type=int, default=2000, help="approximate characters per email")
+    parser.add_argument("-d", "--density", type=float, default=0.01, help="chance each word is a spam keyword")
+    parser.add_argument("-k", "--extra-keywords", type=int, default=0, help="synthetic keywords added to the list")
+    parser.add_argument("-s", "--seed", type=int, default=42, help="random seed for the corpus")
+    parser.add_argument("--backend", action="append", help="backend to run (repeatable, default: all)")
+    parser.add_argument("-o", "--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.messages, args.length, args.density, args.extra_keywords, args.seed, args.backend)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, mode='w') as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,5 +1,10 @@
-# Import the reduce function from the functools module
-from functools import reduce
+import argparse
+import csv
+import json
+import math
+import sys
+
+import numpy as np
 
 
 def get_expenses():
@@ -32,27 +37,351 @@ def get_expenses():
     return expenses
 
 
-def analyze_expenses(expenses):
-    # Sorts expences from high to low using reduce
-    if not expenses:
-        print("\nNo expenses were entered.")
-        return
+class ExpenseAccumulator:
+    # Keeps running total, count, highest and lowest so expenses can be analyzed in one pass
+    # Partial accumulators (for example one per CSV chunk) can be combined with merge
+
+    def __init__(self):
+        self.total = 0
+        self.count = 0
+        self.highest = None
+        self.lowest = None
+
+    def add(self, expense):
+        # Adds one expense dictionary, ties go to the later expense like the old reduce calls
+        amount = expense['amount']
+        self.total += amount
+        self.count += 1
+        if self.highest is None or amount >= self.highest['amount']:
+            self.highest = expense
+        if self.lowest is None or amount <= self.lowest['amount']:
+            self.lowest = expense
+
+    def update(self, expenses):
+        # Adds every expense from any iterable or generator, returns self for chaining
+        for expense in expenses:
+            self.add(expense)
+        return self
+
+    def merge(self, other):
+        # Folds in an accumulator built from expenses that come after this one's
+        self.total += other.total
+        self.count += other.count
+        if other.highest is not None and (self.highest is None or other.highest['amount'] >= self.highest['amount']):
+            self.highest = other.highest
+        if other.lowest is not None and (self.lowest is None or other.lowest['amount'] <= self.lowest['amount']):
+            self.lowest = other.lowest
+        return self
+
+    @property
+    def mean(self):
+        # Average expense, 0 when nothing has been added
+        return self.total / self.count if self.count else 0.0
+
+
+class ExpenseStore:
+    # Column store for expenses: each type is stored once and rows keep a small integer code,
+    # amounts are kept as integer cents in a contiguous int64 array
+    # Rollups (totals, top N, percentiles per type) run as NumPy operations instead of Python loops
+
+    def __init__(self, capacity=1024):
+        self.type_names = []
+        self.type_codes = {}
+        self._codes = np.empty(capacity, dtype=np.int32)
+        self._cents = np.empty(capacity, dtype=np.int64)
+        self.size = 0
+
+    def __len__(self):
+        return self.size
 
-    # Calculate total expense using reduce
-    total_expense = reduce(lambda total, expense: total + expense['amount'], expenses, 0)
+    def _grow(self, needed):
+        # Doubles the buffers until needed rows fit, so appends stay cheap on average
+        capacity = len(self._codes)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        self._codes = np.resize(self._codes, capacity)
+        self._cents = np.resize(self._cents, capacity)
 
-    # Find highest expense using reduce
-    highest_expense = reduce(lambda exp1, exp2: exp1 if exp1['amount'] > exp2['amount'] else exp2, expenses)
+    def type_code(self, expense_type):
+        # Returns the code for an expense type, adding it the first time it is seen
+        code = self.type_codes.get(expense_type)
+        if code is None:
+            code = len(self.type_names)
+            self.type_codes[expense_type] = code
+            self.type_names.append(expense_type)
+        return code
 
-    # Find the lowest expense using reduce
-    lowest_expense = reduce(lambda exp1, exp2: exp1 if exp1['amount'] < exp2['amount'] else exp2, expenses)
+    def add(self, expense_type, amount):
+        # Adds a single expense
+        self._grow(self.size + 1)
+        self._codes[self.size] = self.type_code(expense_type)
+        self._cents[self.size] = round(amount * 100)
+        self.size += 1
+
+    def extend(self, expenses, chunk_size=65536):
+        # Adds expense dictionaries from any iterable, copying them into the arrays a chunk at a time
+        codes = []
+        cents = []
+        for expense in expenses:
+            codes.append(self.type_code(expense['type']))
+            cents.append(round(expense['amount'] * 100))
+            if len(codes) >= chunk_size:
+                self.extend_arrays(codes, cents)
+                codes, cents = [], []
+        if codes:
+            self.extend_arrays(codes, cents)
+        return self
+
+    def extend_arrays(self, codes, cents):
+        # Appends already encoded type codes and integer cent amounts in bulk
+        codes = np.asarray(codes, dtype=np.int32)
+        cents = np.asarray(cents, dtype=np.int64)
+        end = self.size + len(codes)
+        self._grow(end)
+        self._codes[self.size:end] = codes
+        self._cents[self.size:end] = cents
+        self.size = end
+
+    @property
+    def codes(self):
+        # Type code of every stored row
+        return self._codes[:self.size]
+
+    @property
+    def cents(self):
+        # Amount of every stored row in cents
+        return self._cents[:self.size]
+
+    def _cents_for(self, expense_type=None):
+        # Amounts for one expense type, or for every row when no type is given
+        if expense_type is None:
+            return self.cents
+        code = self.type_codes.get(expense_type)
+        if code is None:
+            return self._cents[:0]
+        return self.cents[self.codes == code]
+
+    def totals_by_type(self):
+        # Total dollars per expense type
+        sums = np.zeros(len(self.type_names), dtype=np.int64)
+        np.add.at(sums, self.codes, self.cents)
+        return {name: int(sums[code]) / 100 for code, name in enumerate(self.type_names)}
+
+    def counts_by_type(self):
+        # Number of expenses per expense type
+        counts = np.bincount(self.codes, minlength=len(self.type_names))
+        return {name: int(counts[code]) for code, name in enumerate(self.type_names)}
+
+    def top_n(self, n=5, expense_type=None):
+        # The n largest amounts in dollars, highest first, optionally for one expense type
+        cents = self._cents_for(expense_type)
+        if n <= 0 or len(cents) == 0:
+            return np.empty(0)
+        if n < len(cents):
+            cents = cents[np.argpartition(cents, -n)[-n:]]
+        return np.sort(cents)[::-1] / 100
+
+    def percentile(self, q, expense_type=None):
+        # Percentile (0-100) of amounts in dollars, q may be a single value or a list
+        cents = self._cents_for(expense_type)
+        if len(cents) == 0:
+            return None
+        return np.percentile(cents, q) / 100
+
+    def summary(self):
+        # Builds an ExpenseAccumulator from the arrays so analyze_expenses can display the store
+        summary = ExpenseAccumulator()
+        if self.size == 0:
+            return summary
+        cents = self.cents
+        # reverse argmax/argmin picks the last row on ties, matching ExpenseAccumulator
+        high = self.size - 1 - int(np.argmax(cents[::-1]))
+        low = self.size - 1 - int(np.argmin(cents[::-1]))
+        summary.total = int(cents.sum()) / 100
+        summary.count = self.size
+        summary.highest = {'type': self.type_names[self.codes[high]], 'amount': int(cents[high]) / 100}
+        summary.lowest = {'type': self.type_names[self.codes[low]], 'amount': int(cents[low]) / 100}
+        return summary
+
+
+def analyze_expenses(expenses):
+    # Finds total, highest and lowest expense in a single pass
+    # Accepts a list, any iterable/generator of expenses, an ExpenseStore, or an already filled ExpenseAccumulator
+    if isinstance(expenses, ExpenseAccumulator):
+        summary = expenses
+    elif isinstance(expenses, ExpenseStore):
+        summary = expenses.summary()
+    else:
+        summary = ExpenseAccumulator().update(expenses)
+
+    if summary.count == 0:
+        print("\nNo expenses were entered.")
+        return summary
 
     # Display the results
     print("\nMonthly Expense Analysis")
-    print(f"Total Expense: ${total_expense:,.2f}")
-    print(f"Highest Expense: {highest_expense['type']} - ${highest_expense['amount']:,.2f}")
-    print(f"Lowest Expense:  {lowest_expense['type']} - ${lowest_expense['amount']:,.2f}")
+    print(f"Total Expense: ${summary.total:,.2f}")
+    print(f"Highest Expense: {summary.highest['type']} - ${summary.highest['amount']:,.2f}")
+    print(f"Lowest Expense:  {summary.lowest['type']} - ${summary.lowest['amount']:,.2f}")
+    print(f"Number of Expenses: {summary.count}")
+    print(f"Average Expense: ${summary.mean:,.2f}")
+    return summary
+
+
+
+class ImportReport:
+    # Counts rows read and skipped during a file import, keeps the first few problems for display
+
+    def __init__(self, max_errors=20):
+        self.rows = 0
+        self.skipped = 0
+        self.errors = []
+        self.max_errors = max_errors
+
+    def reject(self, line_number, reason):
+        # Records a malformed row without stopping the import
+        self.skipped += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append((line_number, reason))
+
+
+def parse_amount(text):
+    # Parses an amount, trying plain float() first and only cleaning "$" and "," when that fails
+    # Raises ValueError for text that is not a positive finite number, like the interactive prompt
+    # JSON true/false and digit separators like "1_000" (which float() accepts) are malformed rows, not amounts
+    if isinstance(text, bool):
+        raise ValueError(f"amount '{text}' is not a number")
+    if isinstance(text, (int, float)):
+        amount = float(text)
+    elif "_" in text:
+        raise ValueError(f"amount '{text}' is not a number")
+    else:
+        try:
+            amount = float(text)
+        except ValueError:
+            amount = float(text.strip().replace("$", "").replace(",", ""))
+    if not math.isfinite(amount):
+        raise ValueError(f"amount '{text}' is not a finite number")
+    if amount < 0:
+        raise ValueError(f"amount '{text}' is negative")
+    return amount
+
+
+def _iter_csv_rows(file):
+    # Yields (line_number, type, amount_text), reading column positions from a header if there is one
+    # A row the csv module cannot parse (oversized field, runaway quote) is yielded with its csv.Error as the type
+    reader = csv.reader(file)
+    type_column, amount_column = 0, 1
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            yield reader.line_num, e, None
+            continue
+        if reader.line_num == 1 and row:
+            header = [name.strip().lower() for name in row]
+            if "type" in header and "amount" in header:
+                type_column, amount_column = header.index("type"), header.index("amount")
+                continue
+        if not row:
+            continue
+        if len(row) <= max(type_column, amount_column):
+            yield reader.line_num, None, None
+            continue
+        yield reader.line_num, row[type_column], row[amount_column]
+
+
+def _iter_jsonl_rows(file):
+    # Yields (line_number, type, amount) from JSON lines shaped like {"type": ..., "amount": ...}
+    for line_number, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            yield line_number, record.get("type"), record.get("amount")
+        except (ValueError, AttributeError):
+            yield line_number, None, None
+
+
+def iter_expense_file(path, report=None, chunk_size=10000):
+    # Streams a CSV or JSON-lines ledger in chunks of expense dictionaries, never holding the whole file
+    # Malformed rows are skipped and recorded in report instead of aborting the import
+    report = report if report is not None else ImportReport()
+    is_jsonl = path.lower().endswith((".jsonl", ".ndjson", ".json"))
+    chunk = []
+    with open(path, mode='r', newline='', encoding='utf-8', errors='replace') as file:
+        rows = _iter_jsonl_rows(file) if is_jsonl else _iter_csv_rows(file)
+        for line_number, expense_type, amount_text in rows:
+            if isinstance(expense_type, csv.Error):
+                report.reject(line_number, f"unreadable row: {expense_type}")
+                continue
+            if expense_type is None or amount_text is None:
+                report.reject(line_number, "missing type or amount")
+                continue
+            expense_type = str(expense_type).strip()
+            if not expense_type:
+                report.reject(line_number, "empty expense type")
+                continue
+            try:
+                amount = parse_amount(amount_text)
+            except (ValueError, TypeError) as e:
+                report.reject(line_number, str(e))
+                continue
+            report.rows += 1
+            chunk.append({'type': expense_type, 'amount': amount})
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def import_expenses(path, summary=None, store=None, report=None, chunk_size=10000):
+    # Imports a ledger file into an ExpenseAccumulator (and an ExpenseStore if one is given)
+    # Returns the accumulator and the ImportReport
+    summary = summary if summary is not None else ExpenseAccumulator()
+    report = report if report is not None else ImportReport()
+    for chunk in iter_expense_file(path, report, chunk_size):
+        summary.update(chunk)
+        if store is not None:
+            store.extend(chunk)
+    return summary, report
+
+
+def batch_main(argv):
+    # Non-interactive mode: imports one or more ledger files and prints the analysis
+    # Returns exit status 1 if any file could not be read
+    parser = argparse.ArgumentParser(description="Monthly Expense Analyzer - bulk import")
+    parser.add_argument("files", nargs="+", help="CSV (type,amount) or JSON-lines ledger files")
+    parser.add_argument("--by-type", action="store_true", help="also print totals per expense type")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="rows parsed per chunk")
+    args = parser.parse_args(argv)
+
+    summary = ExpenseAccumulator()
+    store = ExpenseStore() if args.by_type else None
+    status = 0
+    for path in args.files:
+        report = ImportReport()
+        try:
+            import_expenses(path, summary, store, report, args.chunk_size)
+        except OSError as e:
+            print(f"Error: could not read '{path}': {e}", file=sys.stderr)
+            status = 1
+            continue
+        print(f"Imported {report.rows:,} rows from {path}, skipped {report.skipped:,} malformed rows.")
+        for line_number, reason in report.errors:
+            print(f"  line {line_number}: {reason}", file=sys.stderr)
 
+    analyze_expenses(summary)
+    if store is not None and len(store):
+        print("\nTotals by Type")
+        for expense_type, total in sorted(store.totals_by_type().items(), key=lambda item: -item[1]):
+            print(f"{expense_type}: ${total:,.2f}")
+    return status
 
 
 def main():
@@ -64,4 +393,7 @@ def main():
 
 # Run the main function when the script is executed
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if len(sys.argv) > 1:
+        sys.exit(batch_main(sys.argv[1:]))
+    else:
+        main()
\ No newline at end of file
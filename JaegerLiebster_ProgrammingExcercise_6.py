@@ -1,25 +1,271 @@
+import argparse
+import csv
 import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+
+import numpy as np
+
+# Patterns are compiled once when the module loads instead of on every call
+PHONE_PATTERN = re.compile(r'^\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}$')
+SSN_PATTERN = re.compile(r'^\d{3}-\d{2}-\d{4}$')
+ZIP_PATTERN = re.compile(r'^\d{5}(-\d{4})?$')
+
+# Characters the phone pattern accepts between digit groups ([-.\s])
+PHONE_SEPARATORS = "-."
+
+def _shape_code(code):
+    #Class of one ASCII character: d digit, n newline, s other whitespace, x anything unexpected
+    char = chr(code)
+    if char.isdecimal():
+        return "d"
+    if char == "\n":
+        return "n"
+    if char.isspace():
+        return "s"
+    if char in "-.()":
+        return char
+    return "x"
+
+# bytes.translate table that turns an ASCII value into its shape, "(123) 456-7890" -> "(ddd)sddd-dddd"
+SHAPE_TABLE = bytes(ord(_shape_code(code)) if code < 128 else ord("x") for code in range(256))
+
+def _with_trailing_newline(shapes):
+    #Regex "$" also matches just before one trailing newline, so each shape may end in "n"
+    return frozenset(shape.encode() for shape in shapes) | frozenset((shape + "n").encode() for shape in shapes)
+
+PHONE_SHAPES = _with_trailing_newline([
+    opening + "ddd" + closing + first + "ddd" + second + "dddd"
+    for opening in ("", "(") for closing in ("", ")")
+    for first in ("", "-", ".", "s", "n") for second in ("", "-", ".", "s", "n")
+])
+SSN_SHAPES = _with_trailing_newline(["ddd-dd-dddd"])
+ZIP_SHAPES = _with_trailing_newline(["ddddd", "ddddd-dddd"])
+
+def _strip_end(text):
+    #Regex "$" also matches just before one trailing newline, so drop it before scanning
+    if text.endswith("\n"):
+        return text[:-1]
+    return text
+
+def _scan_phone(text):
+    #Checks one candidate against the phone format character by character
+    #str.isdecimal and str.isspace accept the same characters as \d and \s
+    length = len(text)
+    i = 1 if length and text[0] == "(" else 0
+    if i + 3 > length or not text[i:i + 3].isdecimal():
+        return False
+    i += 3
+    if i < length and text[i] == ")":
+        i += 1
+    if i < length and (text[i] in PHONE_SEPARATORS or text[i].isspace()):
+        i += 1
+    if i + 3 > length or not text[i:i + 3].isdecimal():
+        return False
+    i += 3
+    if i < length and (text[i] in PHONE_SEPARATORS or text[i].isspace()):
+        i += 1
+    return length - i == 4 and text[i:].isdecimal()
 
 def validate_phone(phone_number):
-    #Validates phone numbers based on a U.S. format
-    pattern = re.compile(r'^\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}$')
-    if pattern.match(phone_number):
-        return True
-    return False
+    #Validates phone numbers based on a U.S. format, same result as PHONE_PATTERN without the regex engine
+    #ASCII input is translated to its shape and looked up in a set, anything else is scanned per character
+    if phone_number.isascii():
+        return len(phone_number) <= 16 and phone_number.encode().translate(SHAPE_TABLE) in PHONE_SHAPES
+    return _scan_phone(phone_number) or (phone_number.endswith("\n") and _scan_phone(phone_number[:-1]))
 
 def validate_ssn(ssn):
-    #Validates SSN
-    pattern = re.compile(r'^\d{3}-\d{2}-\d{4}$')
-    if pattern.match(ssn):
-        return True
-    return False
+    #Validates SSN (DDD-DD-DDDD), same result as SSN_PATTERN without the regex engine
+    if ssn.isascii():
+        return len(ssn) <= 12 and ssn.encode().translate(SHAPE_TABLE) in SSN_SHAPES
+    ssn = _strip_end(ssn)
+    return (len(ssn) == 11 and ssn[3] == "-" and ssn[6] == "-"
+            and ssn[:3].isdecimal() and ssn[4:6].isdecimal() and ssn[7:].isdecimal())
 
 def validate_zip_code(zip_code):
-    #Validates ZIP code
-    pattern = re.compile(r'^\d{5}(-\d{4})?$')
-    if pattern.match(zip_code):
-        return True
-    return False
+    #Validates ZIP code (DDDDD or DDDDD-DDDD), same result as ZIP_PATTERN without the regex engine
+    if zip_code.isascii():
+        return len(zip_code) <= 11 and zip_code.encode().translate(SHAPE_TABLE) in ZIP_SHAPES
+    zip_code = _strip_end(zip_code)
+    length = len(zip_code)
+    if length == 5:
+        return zip_code.isdecimal()
+    return length == 10 and zip_code[5] == "-" and zip_code[:5].isdecimal() and zip_code[6:].isdecimal()
+
+# Field name -> single value validator, used by validate_column and the record pipeline
+FIELD_VALIDATORS = {
+    "phone": validate_phone,
+    "ssn": validate_ssn,
+    "zip": validate_zip_code,
+}
+
+def validate_phone_regex(phone_number):
+    #Original regex version of validate_phone
+    return PHONE_PATTERN.match(phone_number) is not None
+
+def validate_ssn_regex(ssn):
+    #Original regex version of validate_ssn
+    return SSN_PATTERN.match(ssn) is not None
+
+def validate_zip_code_regex(zip_code):
+    #Original regex version of validate_zip_code
+    return ZIP_PATTERN.match(zip_code) is not None
+
+def _mask_for_chunk(kind, values):
+    #Validates a list of values with one scanner, non-string values (None, NaN) count as invalid
+    scan = FIELD_VALIDATORS[kind]
+    return np.fromiter(
+        (isinstance(value, str) and scan(value) for value in values),
+        dtype=bool, count=len(values))
+
+def _chunks(values, chunk_size):
+    #Splits any iterable into lists of chunk_size values
+    iterator = iter(values)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def validate_column(values, kind, workers=1, chunk_size=100000):
+    #Validates a whole column (list, array or any iterable) and returns a NumPy boolean mask
+    #kind is "phone", "ssn" or "zip", workers > 1 spreads chunks across a process pool
+    if kind not in FIELD_VALIDATORS:
+        raise ValueError(f"Unknown validator '{kind}', expected one of {', '.join(FIELD_VALIDATORS)}")
+
+    if workers <= 1:
+        masks = [_mask_for_chunk(kind, chunk) for chunk in _chunks(values, chunk_size)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = _chunks(values, chunk_size)
+            masks = list(pool.map(_mask_for_chunk, repeat(kind), chunks))
+
+    if not masks:
+        return np.zeros(0, dtype=bool)
+    return np.concatenate(masks)
+
+def validate_columns(columns, workers=1, chunk_size=100000):
+    #Validates several columns at once, columns maps a validator name to its values
+    #Returns a dict of validator name -> boolean mask
+    return {kind: validate_column(values, kind, workers, chunk_size) for kind, values in columns.items()}
+
+# Header names that are matched to a validator when no column is given explicitly
+FIELD_ALIASES = {
+    "phone": ("phone", "phone number", "phone_number"),
+    "ssn": ("ssn", "social security number"),
+    "zip": ("zip", "zip code", "zip_code", "zipcode"),
+}
+
+def find_columns(header):
+    #Guesses which CSV column holds each field from the header names
+    lowered = [name.strip().lower() for name in header]
+    columns = {}
+    for field, aliases in FIELD_ALIASES.items():
+        for alias in aliases:
+            if alias in lowered:
+                columns[field] = header[lowered.index(alias)]
+                break
+    return columns
+
+def validate_records(input_path, valid_path, rejects_path, columns=None):
+    #Streams a CSV of customer records one row at a time, writing good rows to valid_path and bad rows to
+    #rejects_path with a "reasons" column, columns maps a validator ("phone", "ssn", "zip") to a header name
+    #Returns a dict with row counts, rows/sec and seconds spent in each validator
+    field_seconds = {field: 0.0 for field in FIELD_VALIDATORS}
+    field_failures = {field: 0 for field in FIELD_VALIDATORS}
+    total_rows = 0
+    valid_rows = 0
+    start = time.perf_counter()
+
+    with open(input_path, mode='r', newline='') as source, \
+            open(valid_path, mode='w', newline='') as valid_file, \
+            open(rejects_path, mode='w', newline='') as rejects_file:
+        reader = csv.reader(source)
+        try:
+            header = next(reader)
+        except StopIteration:
+            raise ValueError(f"'{input_path}' is empty")
+
+        columns = columns or find_columns(header)
+        missing = [name for name in columns.values() if name not in header]
+        if missing or not columns:
+            raise ValueError(f"Columns not found in '{input_path}': {', '.join(missing) or 'phone/ssn/zip'}")
+        checks = [(field, FIELD_VALIDATORS[field], header.index(name)) for field, name in columns.items()]
+
+        valid_writer = csv.writer(valid_file)
+        rejects_writer = csv.writer(rejects_file)
+        valid_writer.writerow(header)
+        rejects_writer.writerow(header + ["reasons"])
+
+        for row in reader:
+            total_rows += 1
+            reasons = []
+            for field, validator, index in checks:
+                value = row[index] if index < len(row) else None
+                check_start = time.perf_counter()
+                is_valid = value is not None and validator(value)
+                field_seconds[field] += time.perf_counter() - check_start
+                if not is_valid:
+                    field_failures[field] += 1
+                    reasons.append(f"invalid {field}: '{value}'" if value is not None else f"missing {field}")
+
+            if reasons:
+                rejects_writer.writerow(row + ["; ".join(reasons)])
+            else:
+                valid_rows += 1
+                valid_writer.writerow(row)
+
+    elapsed = time.perf_counter() - start
+    return {
+        "rows": total_rows,
+        "valid": valid_rows,
+        "rejected": total_rows - valid_rows,
+        "seconds": elapsed,
+        "rows_per_sec": total_rows / elapsed if elapsed else 0.0,
+        "validator_seconds": {field: field_seconds[field] for field, _, _ in checks},
+        "validator_failures": {field: field_failures[field] for field, _, _ in checks},
+    }
+
+def print_record_report(stats):
+    #Prints the summary returned by validate_records
+    print("--- Record Validation Report ---")
+    print(f"Rows read: {stats['rows']:,}")
+    print(f"Valid rows: {stats['valid']:,}")
+    print(f"Rejected rows: {stats['rejected']:,}")
+    print(f"Throughput: {stats['rows_per_sec']:,.0f} rows/sec ({stats['seconds']:.2f}s)")
+    for field, seconds in stats["validator_seconds"].items():
+        print(f"  {field:<6} {seconds:.3f}s, {stats['validator_failures'][field]:,} failures")
+
+def batch_main(argv):
+    #Command line entry for the record pipeline, exits with status 1 if too many rows are rejected
+    parser = argparse.ArgumentParser(description="Validate phone/SSN/ZIP columns of a customer CSV")
+    parser.add_argument("input", help="customer records CSV with a header row")
+    parser.add_argument("--valid", default="valid_records.csv", help="where to write rows that pass")
+    parser.add_argument("--rejects", default="rejected_records.csv", help="where to write rows that fail")
+    parser.add_argument("--phone-column", help="header of the phone column")
+    parser.add_argument("--ssn-column", help="header of the SSN column")
+    parser.add_argument("--zip-column", help="header of the ZIP code column")
+    parser.add_argument("--max-reject-rate", type=float, default=None,
+                        help="fail (exit 1) if more than this fraction of rows is rejected")
+    args = parser.parse_args(argv)
+
+    columns = {field: name for field, name in
+               (("phone", args.phone_column), ("ssn", args.ssn_column), ("zip", args.zip_column)) if name}
+    try:
+        stats = validate_records(args.input, args.valid, args.rejects, columns or None)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    print_record_report(stats)
+    if args.max_reject_rate is not None and stats["rows"]:
+        reject_rate = stats["rejected"] / stats["rows"]
+        if reject_rate > args.max_reject_rate:
+            print(f"Reject rate {reject_rate:.2%} is above the limit of {args.max_reject_rate:.2%}", file=sys.stderr)
+            return 1
+    return 0
 
 def run_tests():
     #Tests validity of phone number, ssn, and zip code against common formats
@@ -79,6 +325,8 @@ def main():
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(batch_main(sys.argv[1:]))
     run_tests()
     print("\n--- User Input Validation ---\n")
     main()
\ No newline at end of file
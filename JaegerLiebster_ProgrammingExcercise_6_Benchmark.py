@@ -0,0 +1,135 @@
+import argparse
+import json
+import random
+import sys
+import time
+
+from JaegerLiebster_ProgrammingExcercise_6 import (
+    validate_phone, validate_phone_regex, validate_ssn, validate_ssn_regex,
+    validate_zip_code, validate_zip_code_regex
+)
+
+# validator name -> (regex version, regex-free version)
+PAIRS = {
+    "phone": (validate_phone_regex, validate_phone),
+    "ssn": (validate_ssn_regex, validate_ssn),
+    "zip": (validate_zip_code_regex, validate_zip_code),
+}
+
+# valid examples that random edits start from
+SEEDS = {
+    "phone": ["123-456-7890", "(123) 456-7890", "123.456.7890", "123 456 7890", "1234567890", "(123)4567890"],
+    "ssn": ["123-45-6789"],
+    "zip": ["12345", "12345-6789"],
+}
+
+# hand picked inputs around the edges of each format
+EDGE_CASES = [
+    "", "\n", "(", ")", "-", "1", "12345\n", "12345\n\n", "\n12345", "12345 ", " 12345", "12345-",
+    "123-45-6789\n", "123-45-6789\r\n", "123-45-67890", "1234-5-6789", "١٢٣-٤٥-٦٧٨٩", "１２３４５",
+    "(123 456-7890", "123) 456-7890", "((123) 456-7890", "(123)) 456-7890", "123--456-7890",
+    "123\t456\n7890", "123 456 7890", "123\x1c456\x1c7890", "123-456-7890\n", "123-456-7890 \n",
+    "(123)-456-7890", "123456789", "12345678901", "abc-def-ghij", "123-456-789O", "12345-678\n",
+]
+
+# characters random strings are drawn from: digits, separators, whitespace, non-ASCII digits and letters
+ALPHABET = "0123456789" * 4 + "()-.-  \t\n\r\x0b\x0c  \x1c" + "٣５x"
+
+
+def random_string(rng, max_length=14):
+    # builds a string from ALPHABET, digit heavy so near-valid shapes show up often
+    return "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, max_length)))
+
+
+def mutate(rng, text):
+    # applies one to three random insert/delete/replace edits to text
+    chars = list(text)
+    for _ in range(rng.randint(1, 3)):
+        position = rng.randint(0, len(chars))
+        action = rng.random()
+        if action < 0.33 or not chars:
+            chars.insert(position, rng.choice(ALPHABET))
+        elif action < 0.66:
+            del chars[min(position, len(chars) - 1)]
+        else:
+            chars[min(position, len(chars) - 1)] = rng.choice(ALPHABET)
+    return "".join(chars)
+
+
+def make_inputs(name, count, seed):
+    # edge cases, the seed examples, mutated seeds and random strings for one validator
+    rng = random.Random(seed)
+    inputs = list(EDGE_CASES) + list(SEEDS[name])
+    while len(inputs) < count:
+        if rng.random() < 0.6:
+            inputs.append(mutate(rng, rng.choice(SEEDS[name])))
+        else:
+            inputs.append(random_string(rng))
+    return inputs
+
+
+def make_record_inputs(name, count, seed):
+    # ASCII values shaped like a real customer column: mostly valid, some with one typo
+    rng = random.Random(seed)
+    digits = "0123456789"
+    inputs = []
+    for _ in range(count):
+        value = "".join(rng.choice(digits) if char.isdigit() else char for char in rng.choice(SEEDS[name]))
+        if rng.random() < 0.1:
+            value = mutate(rng, value).encode("ascii", "replace").decode()
+        inputs.append(value)
+    return inputs
+
+
+def time_validator(validator, inputs, repeat):
+    # best of repeat runs, in seconds for the whole input list
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for value in inputs:
+            validator(value)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run_suite(count=200000, seed=1, repeat=3):
+    # checks both versions agree on every input, then times them on the fuzz inputs and on
+    # record-like ASCII columns; returns a JSON-ready report
+    report = {"inputs_per_validator": count, "seed": seed, "validators": {}}
+    for name, (regex_version, fast_version) in PAIRS.items():
+        result = {}
+        for label, inputs in (("fuzz", make_inputs(name, count, seed)),
+                              ("records", make_record_inputs(name, count, seed))):
+            mismatches = [value for value in inputs if regex_version(value) != fast_version(value)]
+            regex_seconds = time_validator(regex_version, inputs, repeat)
+            fast_seconds = time_validator(fast_version, inputs, repeat)
+            result[label] = {
+                "valid_inputs": sum(1 for value in inputs if regex_version(value)),
+                "mismatches": len(mismatches),
+                "mismatch_examples": [repr(value) for value in mismatches[:10]],
+                "regex_seconds": regex_seconds,
+                "scanner_seconds": fast_seconds,
+                "speedup": regex_seconds / fast_seconds if fast_seconds else None,
+            }
+        report["validators"][name] = result
+    return report
+
+
+def main(argv):
+    # runs the differential suite, exits with status 1 if any validator disagrees
+    parser = argparse.ArgumentParser(description="Regex vs scanner differential test and benchmark")
+    parser.add_argument("-n", "--count", type=int, default=200000, help="inputs per validator")
+    parser.add_argument("-s", "--seed", type=int, default=1, help="random seed")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="timing runs, the best one is kept")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.count, args.seed, args.repeat)
+    print(json.dumps(report, indent=2))
+    if any(result["mismatches"] for results in report["validators"].values() for result in results.values()):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,4 +1,11 @@
+import argparse
+import os
 import re
+import sys
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
 def split_into_sentences(paragraph):
 
@@ -13,6 +20,329 @@ def split_into_sentences(paragraph):
     sentences = re.findall(sentence_pattern, paragraph, flags=re.DOTALL | re.MULTILINE)
     return sentences
 
+# Patterns used by the streaming splitter, none of them can backtrack past one whitespace run
+START_PATTERN = re.compile(r'[A-Z0-9]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+# a terminator whose end is certain from this chunk alone: newline right after it, or whitespace then a capital/digit
+SENTENCE_END_PATTERN = re.compile(r'[.!?](?=\n|\s+[A-Z0-9])')
+
+# Splitter states
+SEEKING, IN_SENTENCE, AFTER_TERMINATOR = 0, 1, 2
+
+def read_chunks(source, chunk_size=65536):
+
+    # yields text chunks from a file path or an open text file without reading the whole thing
+
+    if isinstance(source, str):
+        with open(source, mode='r', encoding='utf-8', errors='replace', newline='') as file:
+            yield from read_chunks(file, chunk_size)
+        return
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+def _scan_sentences(chunks, keep_text, release=None):
+
+    # state machine shared by iter_sentences and iter_sentence_spans, yields (start, end, text) with
+    # character offsets into the whole stream, text is None when keep_text is False so nothing is copied
+    # release(low, pinned) is called after each chunk: no offset below low will be yielded except those in pinned
+
+    state = SEEKING
+    parts = []      # pieces of the current sentence, up to and including its latest terminator
+    pending = []    # whitespace after a terminator, joins the sentence if the terminator does not end it
+    found_space = False
+    base = 0        # offset of the current chunk in the stream
+    sentence_start = 0
+    sentence_end = 0
+
+    for chunk in chunks:
+        i = 0
+        segment_start = 0
+        length = len(chunk)
+        while i < length:
+            if state == SEEKING:
+                match = START_PATTERN.search(chunk, i)
+                if not match:
+                    break
+                i = segment_start = match.start()
+                sentence_start = base + i
+                state = IN_SENTENCE
+
+            elif state == IN_SENTENCE:
+                match = SENTENCE_END_PATTERN.search(chunk, i)
+                if match:
+                    i = match.end()
+                    if keep_text:
+                        parts.append(chunk[segment_start:i])
+                    yield sentence_start, base + i, "".join(parts) if keep_text else None
+                    parts = []
+                    state = SEEKING
+                    continue
+                # no certain end in this chunk, but a terminator followed only by whitespace
+                # might still end the sentence depending on what the next chunk starts with
+                tail = chunk.rstrip()
+                if len(tail) > i and tail[-1] in ".!?":
+                    sentence_end = base + len(tail)
+                    found_space = len(tail) < length
+                    if keep_text:
+                        parts.append(chunk[segment_start:len(tail)])
+                        pending = [chunk[len(tail):]] if found_space else []
+                    state = AFTER_TERMINATOR
+                elif keep_text:
+                    parts.append(chunk[segment_start:])
+                break
+
+            else:
+                char = chunk[i]
+                if char == "\n" and not found_space:
+                    # newline right after the terminator, the "$" branch of the look-ahead
+                    yield sentence_start, sentence_end, "".join(parts) if keep_text else None
+                    parts = []
+                    state = SEEKING
+                    continue
+                match = WHITESPACE_PATTERN.match(chunk, i)
+                if match:
+                    if keep_text:
+                        pending.append(match.group())
+                    found_space = True
+                    i = match.end()
+                    continue
+                if found_space and START_PATTERN.match(char):
+                    # whitespace then a capital/digit, the sentence ends and the next one starts here
+                    yield sentence_start, sentence_end, "".join(parts) if keep_text else None
+                    parts = []
+                    state = SEEKING
+                    continue
+                # not a sentence end after all, keep going as part of the same sentence
+                if keep_text:
+                    parts.extend(pending)
+                segment_start = i
+                state = IN_SENTENCE
+        base += length
+        if release is not None:
+            if state == SEEKING:
+                release(base, ())
+            elif state == IN_SENTENCE:
+                release(base, (sentence_start,))
+            else:
+                release(base, (sentence_start, sentence_end))
+
+    # a terminator at the very end of the text also ends a sentence, an unfinished sentence is dropped
+    if state == AFTER_TERMINATOR and not found_space:
+        yield sentence_start, sentence_end, "".join(parts) if keep_text else None
+
+def _as_chunks(source, chunk_size):
+
+    # accepts a file path, an open text file, or any iterable of text chunks
+
+    if isinstance(source, str) or hasattr(source, 'read'):
+        return read_chunks(source, chunk_size)
+    return source
+
+def iter_sentences(source, chunk_size=65536):
+
+    # streaming version of split_into_sentences, reads the text in chunks and yields one sentence at a time
+    # source is a file path, an open text file, or any iterable of text chunks
+    # a sentence starts at a capital letter or digit and ends at . ! or ? that is followed by whitespace and
+    # another capital/digit, by a newline, or by the end of the text, which is exactly what sentence_pattern
+    # accepts, but every character is looked at once so the time is linear in the input size
+
+    for _, _, sentence in _scan_sentences(_as_chunks(source, chunk_size), keep_text=True):
+        yield sentence
+
+def iter_sentence_spans(source, chunk_size=65536, release=None):
+
+    # same as iter_sentences but yields (start, end) character offsets instead of copying the text
+    # release is passed to the splitter, see _scan_sentences
+
+    for start, end, _ in _scan_sentences(_as_chunks(source, chunk_size), keep_text=False, release=release):
+        yield start, end
+
+class _ByteOffsets:
+
+    # turns character offsets from the splitter into byte offsets in the UTF-8 file
+    # offsets must be asked for in increasing order, which is how the splitter yields them
+    # release drops the chunks the splitter has moved past, so memory stays at about one chunk
+    # even when a sentence never ends
+
+    def __init__(self):
+        self.chunks = deque()   # (char_base, byte_base, text or None when the chunk is pure ASCII)
+        self.pinned = {}        # char offset -> byte offset for offsets kept past their chunk
+        self.char_total = 0
+        self.byte_total = 0
+        self.cursor_char = 0
+        self.cursor_byte = 0
+
+    def add(self, text, byte_length):
+        self.chunks.append((self.char_total, self.byte_total, None if text.isascii() else text))
+        self.char_total += len(text)
+        self.byte_total += byte_length
+
+    def release(self, low, pinned):
+        # the splitter needs nothing below low except the pinned offsets, work those out and drop the rest
+        self.pinned = {offset: self.pinned[offset] if offset in self.pinned else self._lookup(offset)
+                       for offset in pinned if offset < low}
+        while len(self.chunks) > 1 and self.chunks[1][0] <= low:
+            self.chunks.popleft()
+
+    def _lookup(self, char_offset):
+        # byte offset of any character still in the deque, without touching the cursor
+        for char_base, byte_base, text in reversed(self.chunks):
+            if char_base <= char_offset:
+                if text is None:
+                    return byte_base + (char_offset - char_base)
+                return byte_base + len(text[:char_offset - char_base].encode('utf-8', 'surrogateescape'))
+        raise ValueError(f"character offset {char_offset} was already released")
+
+    def to_bytes(self, char_offset):
+        if char_offset in self.pinned:
+            return self.pinned[char_offset]
+        if char_offset >= self.char_total:
+            return self.byte_total
+        # drop chunks that end before the offset, nothing earlier will be asked for again
+        while len(self.chunks) > 1 and self.chunks[1][0] <= char_offset:
+            self.chunks.popleft()
+        char_base, byte_base, text = self.chunks[0]
+        if text is None:
+            return byte_base + (char_offset - char_base)
+        if self.cursor_char < char_base:
+            self.cursor_char, self.cursor_byte = char_base, byte_base
+        piece = text[self.cursor_char - char_base:char_offset - char_base]
+        self.cursor_byte += len(piece.encode('utf-8', 'surrogateescape'))
+        self.cursor_char = char_offset
+        return self.cursor_byte
+
+def _utf8_boundary(data):
+
+    # length of data without an unfinished multi-byte character at its end
+
+    for back in range(1, min(4, len(data)) + 1):
+        byte = data[-back]
+        if byte & 0xC0 != 0x80:
+            # found the lead byte of the last character, check that all of it is here
+            needed = 4 if byte >= 0xF0 else 3 if byte >= 0xE0 else 2 if byte >= 0xC0 else 1
+            return len(data) - back if needed > back else len(data)
+    return len(data)
+
+def _read_utf8_chunks(file, chunk_size, offsets):
+
+    # reads binary chunks cut on UTF-8 character boundaries and decodes them, recording each one in offsets
+    # surrogateescape keeps each invalid byte as one character so byte offsets stay exact
+
+    leftover = b""
+    while True:
+        block = file.read(chunk_size)
+        data = leftover + block
+        if not data:
+            return
+        cut = _utf8_boundary(data) if block else len(data)
+        leftover = data[cut:]
+        if cut:
+            text = data[:cut].decode('utf-8', 'surrogateescape')
+            offsets.add(text, cut)
+            yield text
+
+def segment_file(path, chunk_size=1 << 20):
+
+    # splits one file into sentences and returns its (start, end) byte spans as a flat array
+    # start/end can be used to slice the original file (or an mmap of it) without copying text
+
+    started = time.perf_counter()
+    offsets = _ByteOffsets()
+    spans = array('q')
+    with open(path, mode='rb') as file:
+        for start, end in iter_sentence_spans(_read_utf8_chunks(file, chunk_size, offsets), release=offsets.release):
+            spans.append(offsets.to_bytes(start))
+            spans.append(offsets.to_bytes(end))
+    return {
+        "file": path,
+        "bytes": offsets.byte_total,
+        "sentences": len(spans) // 2,
+        "seconds": time.perf_counter() - started,
+        "spans": spans,
+    }
+
+def _segment_file_safe(path, chunk_size):
+
+    # worker wrapper so one unreadable file is reported instead of stopping the whole batch
+
+    try:
+        return segment_file(path, chunk_size)
+    except OSError as e:
+        return {"file": path, "error": str(e), "bytes": 0, "sentences": 0, "seconds": 0.0, "spans": array('q')}
+
+def segment_corpus(paths, workers=None, chunk_size=1 << 20, max_in_flight=None):
+
+    # segments many files across a process pool, yielding each file's result in the order given
+
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 2
+    if workers == 1:
+        for path in paths:
+            yield _segment_file_safe(path, chunk_size)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for path in paths:
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+            pending.append(pool.submit(_segment_file_safe, path, chunk_size))
+        while pending:
+            yield pending.popleft().result()
+
+def list_text_files(directory, extensions=(".txt",)):
+
+    # every file under directory with one of the extensions, sorted so runs are repeatable
+
+    found = []
+    for root, _, names in os.walk(directory):
+        for name in names:
+            if name.lower().endswith(extensions):
+                found.append(os.path.join(root, name))
+    return sorted(found)
+
+def batch_main(argv):
+
+    # segments a directory of text files, writes "file<TAB>start<TAB>end" byte spans and prints stats
+
+    parser = argparse.ArgumentParser(description="Split a directory of text files into sentence spans")
+    parser.add_argument("directory", help="folder with text files (searched recursively)")
+    parser.add_argument("-o", "--output", help="where to write the spans (default: stdout)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--ext", action="append", help="file extension to include (default: .txt)")
+    args = parser.parse_args(argv)
+
+    paths = list_text_files(args.directory, tuple(args.ext) if args.ext else (".txt",))
+    output = open(args.output, mode='w', encoding='utf-8') if args.output else sys.stdout
+    total_bytes = 0
+    total_sentences = 0
+    started = time.perf_counter()
+    try:
+        for result in segment_corpus(paths, args.workers):
+            if "error" in result:
+                print(f"Error: could not read '{result['file']}': {result['error']}", file=sys.stderr)
+                continue
+            spans = result["spans"]
+            for index in range(0, len(spans), 2):
+                output.write(f"{result['file']}\t{spans[index]}\t{spans[index + 1]}\n")
+            total_bytes += result["bytes"]
+            total_sentences += result["sentences"]
+            print(f"{result['file']}: {result['sentences']:,} sentences, {result['bytes']:,} bytes",
+                  file=sys.stderr)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    elapsed = time.perf_counter() - started
+    print("\nSummary:   ", file=sys.stderr)
+    print(f"Files: {len(paths):,}  Sentences: {total_sentences:,}  Bytes: {total_bytes:,}", file=sys.stderr)
+    if elapsed:
+        print(f"Throughput: {total_bytes / 1_000_000 / elapsed:.2f} MB/s, {len(paths) / elapsed:.1f} files/s",
+              file=sys.stderr)
+
 def analyze_paragraph():
 
     # gets input from the user analyzes it to find sentences and displays each sentence along with total count
@@ -38,6 +368,26 @@ def analyze_paragraph():
     else:
         print("Could not find any sentences that match the required pattern.")
 
+def analyze_file(path):
+
+    # streams a text file through iter_sentences and prints each sentence as it is found
+
+    count = 0
+    try:
+        for count, sentence in enumerate(iter_sentences(path), 1):
+            print(f"{count}: {sentence.strip()}")
+    except OSError as e:
+        print(f"Error: could not read '{path}': {e}")
+        return
+
+    print("\nSummary:   ")
+    print(f"Total number of sentences found: {count}")
+
 # main part of program that runs analysis
 if __name__ == "__main__":
-    analyze_paragraph()
+    if len(sys.argv) > 1 and os.path.isdir(sys.argv[1]):
+        batch_main(sys.argv[1:])
+    elif len(sys.argv) > 1:
+        analyze_file(sys.argv[1])
+    else:
+        analyze_paragraph()
@@ -0,0 +1,166 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from JaegerLiebster_ProgrammingExcercise_7 import iter_sentences, split_into_sentences
+
+WORDS = ["the", "quick", "brown", "fox", "jumps", "over", "lazy", "dog", "river", "market", "quietly",
+         "morning", "report", "shows", "that", "prices", "rose", "again", "and", "people", "waited"]
+CAPITALS = ["The", "A", "In", "Yesterday", "Most", "Every", "Our", "Nobody", "It", "2024"]
+ABBREVIATIONS = ["Mr.", "Dr.", "St.", "Jan.", "U.S.", "e.g.", "p.m.", "No.", "Inc.", "vs."]
+
+
+def _fill(rng, size, make_piece):
+    # joins pieces from make_piece until the text is at least size characters
+    pieces = []
+    length = 0
+    while length < size:
+        piece = make_piece(rng)
+        pieces.append(piece)
+        length += len(piece)
+    return "".join(pieces)[:size]
+
+
+def prose(rng, size):
+    # ordinary paragraphs: capitalized sentences of 5-25 words with mixed terminators and line breaks
+    def sentence(rng):
+        words = " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 25)))
+        ending = rng.choice(".....!?")
+        gap = "\n\n" if rng.random() < 0.1 else " "
+        return f"{rng.choice(CAPITALS)} {words}{ending}{gap}"
+    return _fill(rng, size, sentence)
+
+
+def no_punctuation(rng, size):
+    # capitalized words with no terminators at all, every capital is a start that never finds an end
+    return _fill(rng, size, lambda rng: rng.choice(CAPITALS + WORDS) + " ")
+
+
+def abbreviations(rng, size):
+    # many abbreviation periods followed by capitals, so almost every "." is a sentence end candidate
+    return _fill(rng, size, lambda rng: f"{rng.choice(ABBREVIATIONS)} {rng.choice(CAPITALS)} {rng.choice(WORDS)} ")
+
+
+def false_ends(rng, size):
+    # terminators followed by lowercase words, candidates that all turn out not to end the sentence
+    # (the text ends on a word so the last period cannot end everything through the end-of-text rule)
+    text = _fill(rng, max(size - 4, 0), lambda rng: f"{rng.choice(CAPITALS)} {rng.choice(WORDS)}. {rng.choice(WORDS)} ")
+    return text.rstrip(".") + " and"
+
+
+def huge_single_line(rng, size):
+    # one very long sentence on a single line, ended once at the very end
+    body = _fill(rng, max(size - 1, 0), lambda rng: rng.choice(WORDS) + " ")
+    return "A" + body[1:] + "."
+
+
+def whitespace_runs(rng, size):
+    # sentences separated by long runs of spaces and tabs, stresses the whitespace look-ahead
+    return _fill(rng, size, lambda rng: f"{rng.choice(CAPITALS)} {rng.choice(WORDS)}." + " \t" * rng.randint(50, 500))
+
+
+GENERATORS = {
+    "prose": prose,
+    "no_punctuation": no_punctuation,
+    "abbreviations": abbreviations,
+    "false_ends": false_ends,
+    "huge_single_line": huge_single_line,
+    "whitespace_runs": whitespace_runs,
+}
+
+CHUNK_SIZE = 65536
+
+SPLITTERS = {
+    "regex": split_into_sentences,
+    # fed as slices so the measured memory is the splitter's own, not a second copy of the document
+    "streaming": lambda text: list(iter_sentences(text[i:i + CHUNK_SIZE] for i in range(0, len(text), CHUNK_SIZE))),
+}
+
+
+def measure(splitter, text, track_memory):
+    # runs one split, returns (seconds, peak bytes allocated or None, sentences)
+    if track_memory:
+        tracemalloc.start()
+        started = time.perf_counter()
+        sentences = splitter(text)
+        seconds = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return seconds, peak, sentences
+    started = time.perf_counter()
+    sentences = splitter(text)
+    return time.perf_counter() - started, None, sentences
+
+
+def run_suite(sizes, kinds=None, splitters=None, timeout=10.0, track_memory=True, seed=7):
+    # runs every splitter on every kind and size; a run is skipped when the previous size, scaled up
+    # quadratically, projects past timeout, so backtracking cases cannot stall the whole suite
+    kinds = kinds or list(GENERATORS)
+    splitters = splitters or list(SPLITTERS)
+    report = {"python": platform.python_version(), "seed": seed, "timeout": timeout, "results": []}
+
+    for kind in kinds:
+        previous = {}   # splitter -> (size, seconds) of its last run on this kind
+        for size in sorted(sizes):
+            text = GENERATORS[kind](random.Random(seed), size)
+            megabytes = len(text.encode("utf-8")) / 1_000_000
+            # the first splitter is the reference, if it was skipped there is nothing to compare against
+            reference = None
+            for name in splitters:
+                row = {"kind": kind, "size": size, "splitter": name}
+                if name in previous:
+                    last_size, last_seconds = previous[name]
+                    projected = last_seconds * (size / last_size) ** 2
+                    if projected > timeout:
+                        row["skipped"] = f"projected {projected:.1f}s from the {last_size} run, over the {timeout}s limit"
+                        report["results"].append(row)
+                        continue
+                seconds, _, sentences = measure(SPLITTERS[name], text, False)
+                row["seconds"] = seconds
+                row["seconds_per_mb"] = seconds / megabytes if megabytes else None
+                row["sentences"] = len(sentences)
+                if track_memory:
+                    _, peak, _ = measure(SPLITTERS[name], text, True)
+                    row["peak_bytes"] = peak
+                    row["peak_bytes_per_mb"] = peak / megabytes if megabytes else None
+                if name == splitters[0]:
+                    reference = sentences
+                    row["matches_reference"] = None
+                else:
+                    row["matches_reference"] = None if reference is None else sentences == reference
+                previous[name] = (size, max(seconds, 1e-9))
+                report["results"].append(row)
+    return report
+
+
+def main(argv):
+    # runs the suite from the command line and writes a JSON report
+    parser = argparse.ArgumentParser(description="Sentence splitter benchmark and pathological-input suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000],
+                        help="document sizes in characters")
+    parser.add_argument("--kind", action="append", choices=list(GENERATORS), help="input kind (repeatable)")
+    parser.add_argument("--splitter", action="append", choices=list(SPLITTERS), help="splitter (repeatable)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="skip runs projected to take longer than this")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("-s", "--seed", type=int, default=7, help="random seed")
+    parser.add_argument("-o", "--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.sizes, args.kind, args.splitter, args.timeout, not args.no_memory, args.seed)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, mode='w') as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+    if any(row.get("matches_reference") is False for row in report["results"]):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
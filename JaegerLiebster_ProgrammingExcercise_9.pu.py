@@ -1,4 +1,18 @@
+import json
+import math
+import numbers
+import os
+import random
+import struct
 import sys
+import tempfile
+import threading
+import time
+import zlib
+from array import array
+from collections import namedtuple
+
+import numpy as np
 
 
 class BankAcct:
@@ -60,6 +74,634 @@ class BankAcct:
         interest_earned = self.balance * self.interest * (num_days / 365)
         return interest_earned
 
+# Outcome of one ledger operation, amounts and balances are in integer cents
+TransactionResult = namedtuple("TransactionResult", ["kind", "number", "amount_cents", "status", "balance_cents"])
+
+# Result statuses
+OK = "ok"
+INVALID_AMOUNT = "invalid_amount"
+INSUFFICIENT_FUNDS = "insufficient_funds"
+UNKNOWN_ACCOUNT = "unknown_account"
+UNKNOWN_OPERATION = "unknown_operation"
+
+
+# Largest balance array('q') can hold, in cents
+MAX_CENTS = 2 ** 63 - 1
+
+
+def to_cents(amount):
+
+    return round(amount * 100)
+
+
+def is_valid_amount(amount):
+
+    # a usable money amount: a real number (not a bool) that is finite, NaN and inf fail every comparison check
+    return isinstance(amount, numbers.Real) and not isinstance(amount, bool) and math.isfinite(amount)
+
+
+def result_cents(amount):
+
+    # amount in cents for a TransactionResult, 0 when the amount is not a usable number
+    return to_cents(amount) if is_valid_amount(amount) else 0
+
+
+class Ledger:
+
+    # many accounts stored column-wise: balances are integer cents in one array('q'), rates in one array('d')
+    # operations follow the same rules as BankAcct.deposit/withdraw but return TransactionResult objects
+    # instead of printing, so large batches are not slowed down by formatting and stdout
+
+    def __init__(self):
+
+        self.names = []
+        self.numbers = []
+        self.index = {}
+        self.balances = array('q')
+        self.rates = array('d')
+
+    def __len__(self):
+
+        return len(self.numbers)
+
+    def open_account(self, name, number, balance, interest=0.03):
+
+        if number in self.index:
+            raise ValueError(f"Account {number} already exists")
+        self.index[number] = len(self.numbers)
+        self.names.append(name)
+        self.numbers.append(number)
+        self.balances.append(to_cents(balance))
+        self.rates.append(float(interest))
+
+    @classmethod
+    def from_accounts(cls, accounts):
+
+        ledger = cls()
+        for acct in accounts:
+            ledger.open_account(acct.name, acct.number, acct.balance, acct.interest)
+        return ledger
+
+    def to_account(self, number):
+
+        i = self.index[number]
+        return BankAcct(self.names[i], number, self.balances[i] / 100, self.rates[i])
+
+    def get_balance(self, number):
+
+        return self.balances[self.index[number]] / 100
+
+    def deposit(self, number, deposit_amount):
+
+        return self.apply([("deposit", number, deposit_amount)])[0]
+
+    def withdraw(self, number, withdraw_amount):
+
+        return self.apply([("withdraw", number, withdraw_amount)])[0]
+
+    def apply(self, operations, results=None):
+
+        # applies (kind, number, amount) tuples in order, kind is "deposit" or "withdraw" and amount is in dollars
+        # a rejected operation (including a NaN, inf, non-numeric or overflowing amount) leaves the balance
+        # unchanged and the rest of the batch still runs
+        # results are appended to the given list as each operation is applied, so a caller still sees every
+        # change made before an unexpected error
+
+        balances = self.balances
+        index = self.index
+        results = [] if results is None else results
+        append = results.append
+        for kind, number, amount in operations:
+            # plain finite int/float amounts pass the inline check (x - x is nan for nan and inf), others are checked fully
+            amount_type = amount.__class__
+            if not ((amount_type is float or amount_type is int) and amount - amount == 0) and not is_valid_amount(amount):
+                i = index.get(number)
+                append(TransactionResult(kind, number, 0, UNKNOWN_ACCOUNT if i is None else INVALID_AMOUNT,
+                                         0 if i is None else balances[i]))
+                continue
+            cents = round(amount * 100)
+            i = index.get(number)
+            if i is None:
+                append(TransactionResult(kind, number, cents, UNKNOWN_ACCOUNT, 0))
+                continue
+            balance = balances[i]
+            if kind == "deposit":
+                if cents <= 0:
+                    append(TransactionResult(kind, number, cents, INVALID_AMOUNT, balance))
+                    continue
+                balance += cents
+            elif kind == "withdraw":
+                if cents <= 0:
+                    append(TransactionResult(kind, number, cents, INVALID_AMOUNT, balance))
+                    continue
+                if cents > balance:
+                    append(TransactionResult(kind, number, cents, INSUFFICIENT_FUNDS, balance))
+                    continue
+                balance -= cents
+            else:
+                append(TransactionResult(kind, number, cents, UNKNOWN_OPERATION, balance))
+                continue
+            if balance > MAX_CENTS:
+                append(TransactionResult(kind, number, cents, INVALID_AMOUNT, balances[i]))
+                continue
+            balances[i] = balance
+            append(TransactionResult(kind, number, cents, OK, balance))
+        return results
+
+
+# Journal record layout: type (1 byte), payload length (2 bytes), payload, crc32 of type+length+payload
+RECORD_HEADER = struct.Struct("<BH")
+RECORD_CRC = struct.Struct("<I")
+DELTA_PAYLOAD = struct.Struct("<Iq")     # account index, signed change in cents
+RATE_PAYLOAD = struct.Struct("<Id")      # account index, new rate
+OPEN_PAYLOAD = struct.Struct("<qdH")     # balance in cents, rate, name length, then name and number as UTF-8
+RECORD_DELTA, RECORD_RATE, RECORD_OPEN = 1, 2, 3
+
+SNAPSHOT_MAGIC = b"BANKSNAP1"
+SNAPSHOT_HEADER = struct.Struct("<QQQ")  # generation, account count, length of the JSON names/numbers block
+
+
+class DurableLedger(Ledger):
+
+    # Ledger whose state survives restarts
+    # every accepted operation is appended to a binary journal and each apply() batch is committed with a
+    # single flush/fsync (group commit); every snapshot_every records the balances are written to a snapshot
+    # and a fresh journal is started, and opening the directory again rebuilds the accounts from the latest
+    # snapshot plus the journal written after it
+    # account numbers must be strings, the journal and snapshot store them as text
+
+    def __init__(self, directory, snapshot_every=1_000_000, sync=True):
+
+        super().__init__()
+        self.directory = directory
+        self.snapshot_every = snapshot_every
+        self.sync = sync
+        self.generation = 0
+        self.records_since_snapshot = 0
+        self._buffer = bytearray()
+        os.makedirs(directory, exist_ok=True)
+
+        self.recovery_seconds = self._recover()
+        self._journal = open(self._journal_path(self.generation), mode='ab')
+
+    def _journal_path(self, generation):
+
+        return os.path.join(self.directory, f"journal.{generation}.log")
+
+    def _snapshot_path(self):
+
+        return os.path.join(self.directory, "snapshot.bin")
+
+    # ----- writing -----
+
+    def _append(self, record_type, payload):
+
+        header = RECORD_HEADER.pack(record_type, len(payload))
+        self._buffer += header
+        self._buffer += payload
+        self._buffer += RECORD_CRC.pack(zlib.crc32(payload, zlib.crc32(header)))
+        self.records_since_snapshot += 1
+
+    def commit(self):
+
+        # writes buffered records in one go and fsyncs once, so a whole batch costs a single disk flush
+
+        if not self._buffer:
+            return
+        self._journal.write(self._buffer)
+        self._journal.flush()
+        if self.sync:
+            os.fsync(self._journal.fileno())
+        self._buffer.clear()
+        if self.records_since_snapshot >= self.snapshot_every:
+            self.snapshot()
+
+    def open_account(self, name, number, balance, interest=0.03):
+
+        # a 42 would be reloaded as "42" (and clash with a "42" account), so only strings are accepted
+        if not isinstance(number, str):
+            raise TypeError(f"Account number must be a string, got {type(number).__name__}")
+        super().open_account(name, number, balance, interest)
+        name_bytes = str(name).encode("utf-8")
+        payload = OPEN_PAYLOAD.pack(self.balances[-1], self.rates[-1], len(name_bytes))
+        self._append(RECORD_OPEN, payload + name_bytes + str(number).encode("utf-8"))
+        self.commit()
+
+    def apply(self, operations):
+
+        # Ledger.apply adds each result as it changes a balance, so if the batch stops on an error every change
+        # already made in memory is still journaled and committed before the error is passed on
+        results = []
+        try:
+            super().apply(operations, results)
+        finally:
+            index = self.index
+            for result in results:
+                if result.status == OK:
+                    change = result.amount_cents if result.kind == "deposit" else -result.amount_cents
+                    self._append(RECORD_DELTA, DELTA_PAYLOAD.pack(index[result.number], change))
+            self.commit()
+        return results
+
+    def adjust_interest_rate(self, number, new_rate):
+
+        if new_rate < 0 or number not in self.index:
+            return False
+        i = self.index[number]
+        self.rates[i] = float(new_rate)
+        self._append(RECORD_RATE, RATE_PAYLOAD.pack(i, self.rates[i]))
+        self.commit()
+        return True
+
+    def snapshot(self):
+
+        # writes every account to a new snapshot (temp file + rename, so a crash leaves the old one intact),
+        # then starts the next journal and removes the one the snapshot replaces
+
+        self._journal.write(self._buffer)
+        self._buffer.clear()
+        self._journal.close()
+
+        generation = self.generation + 1
+        names_block = json.dumps({"names": self.names, "numbers": [str(n) for n in self.numbers]}).encode("utf-8")
+        body = (SNAPSHOT_HEADER.pack(generation, len(self.numbers), len(names_block)) + names_block
+                + self.balances.tobytes() + self.rates.tobytes())
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(handle, mode='wb') as file:
+            file.write(SNAPSHOT_MAGIC + body + RECORD_CRC.pack(zlib.crc32(body)))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self._snapshot_path())
+
+        old_journal = self._journal_path(self.generation)
+        self.generation = generation
+        self.records_since_snapshot = 0
+        self._journal = open(self._journal_path(generation), mode='ab')
+        if os.path.exists(old_journal):
+            os.remove(old_journal)
+
+    def close(self):
+
+        self.commit()
+        self._journal.close()
+
+    # ----- recovery -----
+
+    def _recover(self):
+
+        # loads the snapshot, replays the journal tail and returns how long that took
+
+        start = time.perf_counter()
+        snapshot_path = self._snapshot_path()
+        if os.path.exists(snapshot_path):
+            self._load_snapshot(snapshot_path)
+        self._replay(self._journal_path(self.generation))
+
+        # a crash between writing a snapshot and removing the old journal can leave older journals behind
+        for name in os.listdir(self.directory):
+            if name.startswith("journal.") and name != os.path.basename(self._journal_path(self.generation)):
+                os.remove(os.path.join(self.directory, name))
+        return time.perf_counter() - start
+
+    def _load_snapshot(self, path):
+
+        with open(path, mode='rb') as file:
+            data = file.read()
+        body = data[len(SNAPSHOT_MAGIC):-RECORD_CRC.size]
+        if not data.startswith(SNAPSHOT_MAGIC) or RECORD_CRC.unpack(data[-RECORD_CRC.size:])[0] != zlib.crc32(body):
+            raise ValueError(f"Snapshot '{path}' is damaged")
+
+        generation, count, names_length = SNAPSHOT_HEADER.unpack_from(body)
+        position = SNAPSHOT_HEADER.size
+        names_block = json.loads(body[position:position + names_length].decode("utf-8"))
+        position += names_length
+        self.balances = array('q')
+        self.balances.frombytes(body[position:position + 8 * count])
+        self.rates = array('d')
+        self.rates.frombytes(body[position + 8 * count:position + 16 * count])
+        self.names = names_block["names"]
+        self.numbers = names_block["numbers"]
+        self.index = {number: i for i, number in enumerate(self.numbers)}
+        self.generation = generation
+
+    def _replay(self, path):
+
+        # applies every complete record; a torn or corrupt tail (crash mid-write) is cut off
+
+        if not os.path.exists(path):
+            return
+        with open(path, mode='rb') as file:
+            data = file.read()
+
+        balances = self.balances
+        position = 0
+        end = len(data)
+        while position + RECORD_HEADER.size <= end:
+            record_type, length = RECORD_HEADER.unpack_from(data, position)
+            payload_start = position + RECORD_HEADER.size
+            record_end = payload_start + length + RECORD_CRC.size
+            if record_end > end:
+                break
+            payload = data[payload_start:payload_start + length]
+            expected = RECORD_CRC.unpack_from(data, payload_start + length)[0]
+            if zlib.crc32(payload, zlib.crc32(data[position:payload_start])) != expected:
+                break
+
+            if record_type == RECORD_DELTA:
+                i, change = DELTA_PAYLOAD.unpack(payload)
+                balances[i] += change
+            elif record_type == RECORD_RATE:
+                i, rate = RATE_PAYLOAD.unpack(payload)
+                self.rates[i] = rate
+            elif record_type == RECORD_OPEN:
+                cents, rate, name_length = OPEN_PAYLOAD.unpack_from(payload)
+                name = payload[OPEN_PAYLOAD.size:OPEN_PAYLOAD.size + name_length].decode("utf-8")
+                number = payload[OPEN_PAYLOAD.size + name_length:].decode("utf-8")
+                Ledger.open_account(self, name, number, cents / 100, rate)
+            position = record_end
+            self.records_since_snapshot += 1
+
+        if position < end:
+            print(f"Warning: discarded {end - position} damaged bytes at the end of '{path}'.", file=sys.stderr)
+            with open(path, mode='r+b') as file:
+                file.truncate(position)
+
+
+def benchmark_durable_ledger(directory, num_accounts=100000, num_transactions=1000000, batch_size=1000, seed=1):
+
+    # measures journal write throughput and how long reopening (snapshot + journal replay) takes
+
+    rng = random.Random(seed)
+    ledger = DurableLedger(directory, snapshot_every=10 ** 12)
+    ledger.sync = False
+    for n in range(num_accounts):
+        ledger.open_account(f"Customer {n}", f"{n:09d}", rng.randint(0, 5000))
+    ledger.sync = True
+    ledger.snapshot()
+
+    numbers = ledger.numbers
+    operations = [(rng.choice(("deposit", "withdraw")), rng.choice(numbers), rng.randint(1, 50000) / 100)
+                  for _ in range(num_transactions)]
+    start = time.perf_counter()
+    for batch_start in range(0, len(operations), batch_size):
+        ledger.apply(operations[batch_start:batch_start + batch_size])
+    write_seconds = time.perf_counter() - start
+    expected = ledger.balances.tobytes()
+    ledger.close()
+
+    reopened = DurableLedger(directory)
+    recovered = reopened.balances.tobytes() == expected
+    reopened.close()
+    return {
+        "transactions": num_transactions,
+        "write_seconds": write_seconds,
+        "transactions_per_sec": num_transactions / write_seconds if write_seconds else 0.0,
+        "recovery_seconds": reopened.recovery_seconds,
+        "journal_records_replayed": reopened.records_since_snapshot,
+        "recovered_correctly": recovered,
+    }
+
+
+class Portfolio:
+
+    # balances and interest rates of many accounts held in NumPy arrays so interest for the whole book
+    # is one vectorized call instead of a loop of BankAcct.calculate_interest
+
+    def __init__(self, numbers, balances, rates):
+
+        self.numbers = list(numbers)
+        self.index = {number: i for i, number in enumerate(self.numbers)}
+        self.balances = np.asarray(balances, dtype=np.float64).copy()
+        self.rates = np.asarray(rates, dtype=np.float64).copy()
+        if not (len(self.numbers) == len(self.balances) == len(self.rates)):
+            raise ValueError("numbers, balances and rates must be the same length")
+
+    def __len__(self):
+
+        return len(self.numbers)
+
+    @classmethod
+    def from_accounts(cls, accounts):
+
+        accounts = list(accounts)
+        return cls([acct.number for acct in accounts],
+                   [acct.balance for acct in accounts],
+                   [acct.interest for acct in accounts])
+
+    @classmethod
+    def from_ledger(cls, ledger):
+
+        return cls(ledger.numbers,
+                   np.frombuffer(ledger.balances, dtype=np.int64) / 100,
+                   np.frombuffer(ledger.rates, dtype=np.float64))
+
+    def calculate_interest(self, num_days):
+
+        # simple interest for every account, same formula as BankAcct.calculate_interest
+
+        if num_days < 0:
+            print("Error: Number of days must be non-negative.", file=sys.stderr)
+            return np.zeros(len(self.balances))
+        return self.balances * self.rates * (num_days / 365)
+
+    def daily_interest(self):
+
+        return self.calculate_interest(1)
+
+    def calculate_compound_interest(self, num_days, periods_per_year=365):
+
+        # interest for every account when it is compounded periods_per_year times a year
+
+        if num_days < 0:
+            print("Error: Number of days must be non-negative.", file=sys.stderr)
+            return np.zeros(len(self.balances))
+        growth = np.power(1 + self.rates / periods_per_year, periods_per_year * num_days / 365)
+        return self.balances * (growth - 1)
+
+    def accrue(self, num_days, compound=False, periods_per_year=365):
+
+        # adds the period's interest to every balance and returns the interest that was added
+
+        if compound:
+            interest = self.calculate_compound_interest(num_days, periods_per_year)
+        else:
+            interest = self.calculate_interest(num_days)
+        self.balances += interest
+        return interest
+
+    def adjust_interest_rate(self, new_rates, numbers=None):
+
+        # sets new rates in bulk, new_rates is one rate for every selected account or a single rate for all
+        # numbers picks the accounts (default: every account), negative rates are refused per account
+        # returns a boolean array of which selected accounts were changed
+
+        if numbers is None:
+            positions = np.arange(len(self.rates))
+        else:
+            positions = np.fromiter((self.index[number] for number in numbers), dtype=np.intp)
+        new_rates = np.broadcast_to(np.asarray(new_rates, dtype=np.float64), positions.shape)
+        valid = new_rates >= 0
+        self.rates[positions[valid]] = new_rates[valid]
+        rejected = int((~valid).sum())
+        if rejected:
+            print(f"Error: {rejected} interest rate(s) were negative and not changed.", file=sys.stderr)
+        return valid
+
+    def get_balance(self, number):
+
+        return float(self.balances[self.index[number]])
+
+
+class AccountManager:
+
+    # serves deposits, withdrawals and transfers on shared BankAcct objects from many threads
+    # every account has its own lock, transfers take both locks in registration order so two
+    # opposite transfers can never deadlock, and nothing is printed so handlers stay quiet
+
+    def __init__(self, accounts=()):
+
+        self.accounts = {}
+        self.locks = {}
+        self.order = {}
+        self._registry_lock = threading.Lock()
+        for acct in accounts:
+            self.register(acct)
+
+    def register(self, acct):
+
+        with self._registry_lock:
+            if acct.number in self.accounts:
+                raise ValueError(f"Account {acct.number} already exists")
+            self.order[acct.number] = len(self.order)
+            self.locks[acct.number] = threading.Lock()
+            self.accounts[acct.number] = acct
+
+    def get_balance(self, number):
+
+        with self.locks[number]:
+            return self.accounts[number].balance
+
+    def deposit(self, number, deposit_amount):
+
+        # amounts are checked before any lock, "not amount > 0" keeps BankAcct.deposit's rule and also refuses NaN
+        acct = self.accounts.get(number)
+        if acct is None:
+            return TransactionResult("deposit", number, result_cents(deposit_amount), UNKNOWN_ACCOUNT, 0)
+        if not is_valid_amount(deposit_amount) or not deposit_amount > 0:
+            return TransactionResult("deposit", number, result_cents(deposit_amount), INVALID_AMOUNT,
+                                     to_cents(self.get_balance(number)))
+        with self.locks[number]:
+            acct.balance += deposit_amount
+            balance = acct.balance
+        return TransactionResult("deposit", number, to_cents(deposit_amount), OK, to_cents(balance))
+
+    def withdraw(self, number, withdraw_amount):
+
+        acct = self.accounts.get(number)
+        if acct is None:
+            return TransactionResult("withdraw", number, result_cents(withdraw_amount), UNKNOWN_ACCOUNT, 0)
+        if not is_valid_amount(withdraw_amount) or not withdraw_amount > 0:
+            return TransactionResult("withdraw", number, result_cents(withdraw_amount), INVALID_AMOUNT,
+                                     to_cents(self.get_balance(number)))
+        with self.locks[number]:
+            if withdraw_amount > acct.balance:
+                status = INSUFFICIENT_FUNDS
+            else:
+                acct.balance -= withdraw_amount
+                status = OK
+            balance = acct.balance
+        return TransactionResult("withdraw", number, to_cents(withdraw_amount), status, to_cents(balance))
+
+    def transfer(self, from_number, to_number, amount):
+
+        # moves amount between two accounts atomically, the result carries the source account's balance
+
+        source = self.accounts.get(from_number)
+        target = self.accounts.get(to_number)
+        if source is None or target is None:
+            return TransactionResult("transfer", from_number, result_cents(amount), UNKNOWN_ACCOUNT, 0)
+        if not is_valid_amount(amount) or not amount > 0 or from_number == to_number:
+            return TransactionResult("transfer", from_number, result_cents(amount), INVALID_AMOUNT,
+                                     to_cents(self.get_balance(from_number)))
+
+        first, second = sorted((from_number, to_number), key=self.order.__getitem__)
+        with self.locks[first], self.locks[second]:
+            if amount > source.balance:
+                status = INSUFFICIENT_FUNDS
+            else:
+                source.balance -= amount
+                target.balance += amount
+                status = OK
+            balance = source.balance
+        return TransactionResult("transfer", from_number, to_cents(amount), status, to_cents(balance))
+
+
+def stress_account_manager(thread_counts=(1, 2, 4, 8), ops_per_thread=20000, num_accounts=50, seed=1):
+
+    # hammers one AccountManager with random transfers, deposits and withdrawals from several threads
+    # amounts are whole dollars so float balances stay exact, and the final total must equal the
+    # starting total plus accepted deposits minus accepted withdrawals (a lost update would break that)
+
+    report = []
+    for thread_count in thread_counts:
+        accounts = [BankAcct(f"Customer {n}", f"{n:06d}", 1000) for n in range(num_accounts)]
+        manager = AccountManager(accounts)
+        numbers = [acct.number for acct in accounts]
+        starting_total = sum(acct.balance for acct in accounts)
+        net_change = [0] * thread_count
+
+        def worker(worker_id):
+            rng = random.Random(seed * 1000 + worker_id)
+            change = 0
+            for _ in range(ops_per_thread):
+                roll = rng.random()
+                amount = rng.randint(1, 100)
+                if roll < 0.6:
+                    manager.transfer(rng.choice(numbers), rng.choice(numbers), amount)
+                elif roll < 0.8:
+                    if manager.deposit(rng.choice(numbers), amount).status == OK:
+                        change += amount
+                elif manager.withdraw(rng.choice(numbers), amount).status == OK:
+                    change -= amount
+            net_change[worker_id] = change
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(thread_count)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        seconds = time.perf_counter() - start
+
+        final_total = sum(acct.balance for acct in accounts)
+        operations = thread_count * ops_per_thread
+        report.append({
+            "threads": thread_count,
+            "operations": operations,
+            "seconds": seconds,
+            "ops_per_sec": operations / seconds if seconds else 0.0,
+            "consistent": final_total == starting_total + sum(net_change),
+        })
+    return report
+
+
+def time_ledger_replay(num_accounts=100000, num_transactions=1000000, seed=1):
+
+    # builds a ledger and replays random deposits/withdrawals through it, returns (seconds, results)
+
+    rng = random.Random(seed)
+    ledger = Ledger()
+    for n in range(num_accounts):
+        ledger.open_account(f"Customer {n}", f"{n:09d}", rng.randint(0, 5000))
+    numbers = ledger.numbers
+    operations = [(rng.choice(("deposit", "withdraw")), rng.choice(numbers), rng.randint(1, 50000) / 100)
+                  for _ in range(num_transactions)]
+
+    start = time.perf_counter()
+    results = ledger.apply(operations)
+    return time.perf_counter() - start, results
+
+
 def test_bank_acct():
 
     print("--- 1. Creating new account ---")
@@ -100,4 +742,20 @@ def test_bank_acct():
     print(acct1)
 
 if __name__ == "__main__":
-    test_bank_acct()
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == "--ledger-replay":
+        seconds, results = time_ledger_replay()
+        accepted = sum(1 for result in results if result.status == OK)
+        print(f"Replayed {len(results):,} transactions in {seconds:.2f}s "
+              f"({len(results) / seconds:,.0f}/s), {accepted:,} accepted")
+    elif len(sys.argv) > 2 and sys.argv[1] == "--durable-bench":
+        stats = benchmark_durable_ledger(sys.argv[2])
+        print(f"Wrote {stats['transactions']:,} transactions in {stats['write_seconds']:.2f}s "
+              f"({stats['transactions_per_sec']:,.0f}/s)")
+        print(f"Recovered {stats['journal_records_replayed']:,} journal records in {stats['recovery_seconds']:.2f}s, "
+              f"balances {'match' if stats['recovered_correctly'] else 'DO NOT MATCH'}")
+    elif len(sys.argv) > 1 and sys.argv[1] == "--stress":
+        for row in stress_account_manager():
+            print(f"{row['threads']} thread(s): {row['ops_per_sec']:,.0f} ops/s, "
+                  f"balances {'consistent' if row['consistent'] else 'LOST UPDATES'}")
+    else:
+        test_bank_acct()
\ No newline at end of file
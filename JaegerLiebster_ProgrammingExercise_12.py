@@ -1,113 +1,560 @@
-import numpy as np
+import argparse
+import copy
 import csv
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
 
 # Configuration
 FILE_NAME = 'grades.csv'
-exam_names = ['Exam 1', 'Exam 2', 'Exam 3']
-grades_list = []
-
-
-# Load the data into a NumPy array using the CSV module
-try:
-    # Use 'with open' to ensure the file is properly closed after reading
-    with open(FILE_NAME, mode='r', newline='') as file:
-        reader = csv.reader(file)
-
-        # Skip the header row
-        try:
-            next(reader)
-        except StopIteration:
-            print("Error: The CSV file is empty.")
-            exit()
-
-        # Iterate through each student row
-        for row in reader:
-            # The grades are assumed to start at index 2
-            # Convert the grade strings to floats
-            try:
-                grades = [float(grade) for grade in row[2:]]
-                grades_list.append(grades)
-            except ValueError:
-                print(f"Skipping row due to non-numeric grade data: {row}")
-                continue # Skip rows with invalid grade data
-
-    # Convert the final list of lists into a NumPy array
-    grades_array = np.array(grades_list)
-
-except FileNotFoundError:
-    print(f"Error: The file '{FILE_NAME}' was not found.")
-    print("Please ensure the CSV file is in the same directory as this script.")
-    exit()
-
-# 2. Print the first few rows of the dataset
-print("1. Data Loaded Directly from File & 2. First 5 Rows")
-print("---------------------------------------------------------")
-print(f"File: {FILE_NAME}")
-print(f"NumPy Array Shape: {grades_array.shape}")
-print("\nFirst 5 Rows:")
-print(grades_array[:5])
-print("---------------------------------------------------------")
+GRADES_CACHE_VERSION = 1
+
+
+def _parse_grade_lines(lines, first_line, columns, dtype, rejected):
+    """Parses CSV lines with np.loadtxt, halving the list around bad rows and recording their line numbers."""
+    if len(lines) == 1 and not lines[0].strip():
+        return np.empty((0, len(columns)), dtype=dtype)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)  # "input contained no data" for blank-only chunks
+            return np.loadtxt(lines, delimiter=',', usecols=columns, dtype=dtype,
+                              quotechar='"', comments=None, ndmin=2)
+    except ValueError:
+        if len(lines) == 1:
+            rejected.append(first_line)
+            return np.empty((0, len(columns)), dtype=dtype)
+    middle = len(lines) // 2
+    return np.concatenate((
+        _parse_grade_lines(lines[:middle], first_line, columns, dtype, rejected),
+        _parse_grade_lines(lines[middle:], first_line + middle, columns, dtype, rejected),
+    ))
+
+
+def _read_grade_header(file):
+    """Reads the header row from an open grades CSV, raising ValueError if the file is empty."""
+    header = next(csv.reader([file.readline()]), None)
+    if not header:
+        raise ValueError("The CSV file is empty.")
+    return header
+
+
+def _iter_grade_chunks(file, header, dtype, chunk_bytes, rejected):
+    """Yields (grades chunk, characters read) for the rest of an open grades CSV."""
+    columns = tuple(range(2, len(header)))
+    line_number = 2
+    while True:
+        lines = file.readlines(chunk_bytes)
+        if not lines:
+            break
+        yield _parse_grade_lines(lines, line_number, columns, dtype, rejected), sum(map(len, lines))
+        line_number += len(lines)
+
+
+def iter_grade_chunks(file_name, dtype=np.float64, chunk_bytes=1 << 22, rejected=None):
+    """Streams a grades CSV as 2D arrays, appending line numbers of skipped rows to rejected."""
+    rejected = rejected if rejected is not None else []
+    with open(file_name, mode='r') as file:
+        header = _read_grade_header(file)
+        for chunk, _ in _iter_grade_chunks(file, header, dtype, chunk_bytes, rejected):
+            yield chunk
+
+
+def load_grades(file_name, dtype=np.float64, chunk_bytes=1 << 22):
+    """Loads the grade columns into one NumPy array, returns (grades, line numbers of skipped rows)."""
+    rejected = []
+    with open(file_name, mode='r') as file:
+        header = _read_grade_header(file)
+        width = len(header) - 2 if len(header) > 2 else 0
+
+        buffer = None
+        rows = 0
+        for chunk, characters in _iter_grade_chunks(file, header, dtype, chunk_bytes, rejected):
+            if buffer is None:
+                # Size the buffer from the first chunk's bytes per row, growing later if that was low
+                estimate = os.path.getsize(file_name) * len(chunk) // max(characters, 1)
+                buffer = np.empty((max(estimate + estimate // 16, len(chunk)), width), dtype=dtype)
+            elif rows + len(chunk) > len(buffer):
+                grown = np.empty((max(rows + len(chunk), len(buffer) * 3 // 2), width), dtype=dtype)
+                grown[:rows] = buffer[:rows]
+                buffer = grown
+            buffer[rows:rows + len(chunk)] = chunk
+            rows += len(chunk)
+
+    if buffer is None:
+        return np.empty((0, width), dtype=dtype), rejected
+    buffer.resize((rows, width), refcheck=False)
+    return buffer, rejected
+
+
+def _file_sha256(file_name):
+    """Returns the hex SHA-256 of a file, read in 1 MB blocks."""
+    digest = hashlib.sha256()
+    with open(file_name, mode='rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def grades_cache_paths(file_name):
+    """Returns the (array, header) paths of the binary cache kept next to a grades CSV."""
+    return file_name + ".cache.npy", file_name + ".cache.json"
+
+
+def _read_grades_cache(file_name, dtype):
+    """Returns (grades, rejected) from the cache if it still matches the CSV, otherwise None."""
+    array_path, header_path = grades_cache_paths(file_name)
+    try:
+        with open(header_path, mode='r') as file:
+            header = json.load(file)
+        source = os.stat(file_name)
+        if header.get("version") != GRADES_CACHE_VERSION or header["size"] != source.st_size:
+            return None
+        if np.dtype(header["dtype"]) != np.dtype(dtype):
+            return None
+        if header["mtime_ns"] != source.st_mtime_ns:
+            # touched or copied but maybe not edited, the hash decides and a match refreshes the mtime
+            if header["sha256"] != _file_sha256(file_name):
+                return None
+            header["mtime_ns"] = source.st_mtime_ns
+            _write_json_atomic(header_path, header)
+        grades = np.load(array_path, mmap_mode='r')
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if grades.dtype != np.dtype(dtype) or list(grades.shape) != header["shape"]:
+        return None
+    return grades, header["rejected"]
+
+
+def _write_json_atomic(path, data):
+    """Writes JSON through a temporary file and os.replace, so a report process never reads a half-written header."""
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, mode='w') as file:
+        json.dump(data, file)
+    os.replace(temp_path, path)
+
+
+def _write_grades_cache(file_name, grades, rejected, source, sha256):
+    """Saves the array, then the header that describes it."""
+    array_path, header_path = grades_cache_paths(file_name)
+    temp_path = f"{array_path}.{os.getpid()}.tmp"
+    with open(temp_path, mode='wb') as file:
+        np.save(file, grades)
+    os.replace(temp_path, array_path)
+    _write_json_atomic(header_path, {
+        "version": GRADES_CACHE_VERSION,
+        "size": source.st_size,
+        "mtime_ns": source.st_mtime_ns,
+        "sha256": sha256,
+        "dtype": np.dtype(grades.dtype).str,
+        "shape": list(grades.shape),
+        "rejected": rejected,
+    })
+
+
+def load_grades_cached(file_name, dtype=np.float64):
+    """Loads grades like load_grades, memory-mapping a .npy cache kept next to the CSV."""
+    # Later loads share the read-only mapped pages, a directory that cannot be written just skips the cache
+    cached = _read_grades_cache(file_name, dtype)
+    if cached is not None:
+        return cached
+
+    source = os.stat(file_name)
+    sha256 = _file_sha256(file_name)
+    grades, rejected = load_grades(file_name, dtype)
+    if os.stat(file_name).st_mtime_ns != source.st_mtime_ns:
+        return grades, rejected   # the CSV changed while it was being read, do not cache this copy
+    try:
+        _write_grades_cache(file_name, grades, rejected, source, sha256)
+    except OSError:
+        return grades, rejected
+    return np.load(grades_cache_paths(file_name)[0], mmap_mode='r'), rejected
+
+
+class QuantileSketch:
+    """Mergeable quantile summary that counts values rounded to a grid of width resolution."""
+
+    def __init__(self, resolution=0.01):
+        self.resolution = resolution
+        self.keys = np.empty(0, dtype=np.int64)
+        self.counts = np.empty(0, dtype=np.int64)
+        # Quantiles are off by at most resolution / 2, the 0.01 default is exact for grades with two decimals
+        # Values too large for the grid (including +-inf) are kept as they are, nan is only counted
+        self.limit = 2.0 ** 52 * resolution
+        self.outliers = np.empty(0)
+        self.nan_count = 0
+
+    def __len__(self):
+        return int(self.counts.sum()) + len(self.outliers) + self.nan_count
+
+    def _combine(self, keys, counts):
+        if len(self.keys):
+            keys = np.concatenate((self.keys, keys))
+            counts = np.concatenate((self.counts, counts))
+        self.keys, inverse = np.unique(keys, return_inverse=True)
+        self.counts = np.bincount(inverse, weights=counts, minlength=len(self.keys)).astype(np.int64)
+
+    def update(self, values):
+        """Adds an array of values."""
+        values = np.ravel(values)
+        on_grid = np.abs(values) < self.limit
+        if not on_grid.all():
+            nans = np.isnan(values)
+            self.nan_count += int(nans.sum())
+            self.outliers = np.sort(np.concatenate((self.outliers, values[~on_grid & ~nans])))
+            values = values[on_grid]
+        keys = np.rint(values / self.resolution).astype(np.int64)
+        if not len(keys):
+            return
+        low, high = keys.min(), keys.max()
+        if high - low <= 4 * len(keys) + 4096:
+            # Grades sit in a narrow range, counting into a dense array is much cheaper than sorting
+            counts = np.bincount(keys - low)
+            present = np.flatnonzero(counts)
+            keys, counts = present + low, counts[present]
+        else:
+            keys, counts = np.unique(keys, return_counts=True)
+        self._combine(keys, counts)
+
+    def merge(self, other):
+        """Adds the counts of another sketch with the same resolution."""
+        if other.resolution != self.resolution:
+            raise ValueError("Cannot merge sketches with different resolutions.")
+        if len(other.keys):
+            self._combine(other.keys, other.counts)
+        if len(other.outliers):
+            self.outliers = np.sort(np.concatenate((self.outliers, other.outliers)))
+        self.nan_count += other.nan_count
+        return self
+
+    def _value_at(self, rank, ends, below):
+        # rank-th smallest value: outliers below the grid, then the grid, then outliers above it
+        if rank < below:
+            return self.outliers[rank]
+        rank -= below
+        grid_total = int(ends[-1]) if len(ends) else 0
+        if rank < grid_total:
+            return self.keys[np.searchsorted(ends, rank + 1)] * self.resolution
+        return self.outliers[below + rank - grid_total]
+
+    def _ranks(self, ranks):
+        # Values at the given ranks, or None if the answer is nan
+        if len(self) == 0 or self.nan_count:
+            return None
+        ends = np.cumsum(self.counts)
+        below = int(np.searchsorted(self.outliers, 0))
+        return [self._value_at(rank, ends, below) for rank in ranks]
+
+    def quantile(self, q):
+        """Returns the q quantile (0 <= q <= 1) interpolated like np.quantile, nan if empty or holding a nan."""
+        position = q * (len(self) - 1)
+        lower = int(np.floor(position))
+        values = self._ranks((lower, min(lower + 1, len(self) - 1)))
+        if values is None:
+            return np.nan
+        low_value, high_value = values
+        fraction = position - lower
+        with np.errstate(invalid='ignore'):
+            difference = np.float64(high_value) - low_value
+            if fraction >= 0.5:
+                return high_value - difference * (1 - fraction)
+            return low_value + difference * fraction
+
+    def median(self):
+        """Returns the median like np.median: the middle value, or the mean of the two middle values."""
+        total = len(self)
+        values = self._ranks(sorted({(total - 1) // 2, total // 2}))
+        if values is None:
+            return np.nan
+        with np.errstate(invalid='ignore'):
+            return np.mean(values)
+
+
+def _merge_moments(count_a, mean_a, m2_a, count_b, mean_b, m2_b):
+    """Combines two (count, mean, sum of squared deviations) summaries."""
+    count = count_a + count_b
+    if not np.any(count):
+        return count, mean_a, m2_a
+    delta = mean_b - mean_a
+    share = np.divide(count_b, count, out=np.zeros_like(delta), where=count > 0)
+    mean = mean_a + delta * share
+    m2 = m2_a + m2_b + delta * delta * count_a * share
+    return count, mean, m2
+
+
+class GradeStats:
+    """Per-exam and overall statistics built in one pass over chunks of grades."""
+
+    def __init__(self, num_exams, passing_grade=60, resolution=0.01):
+        self.num_exams = num_exams
+        self.passing_grade = passing_grade
+        self.count = 0
+        self.mean = np.zeros(num_exams)
+        self.m2 = np.zeros(num_exams)
+        self.min = np.full(num_exams, np.inf)
+        self.max = np.full(num_exams, -np.inf)
+        # Mean and m2 (sum of squared deviations) are merged chunk by chunk with the parallel Welford update
+        self.passed = np.zeros(num_exams, dtype=np.int64)
+        self.sketches = [QuantileSketch(resolution) for _ in range(num_exams)]
+
+    def update(self, chunk):
+        """Adds a 2D chunk of grades, one row per student."""
+        chunk = np.asarray(chunk, dtype=np.float64).reshape(-1, self.num_exams)
+        if not len(chunk):
+            return self
+        with np.errstate(invalid='ignore', over='ignore'):
+            # an inf grade gives a nan spread, the same as np.std, without the warnings
+            chunk_mean = chunk.mean(axis=0)
+            chunk_m2 = ((chunk - chunk_mean) ** 2).sum(axis=0)
+            self.count, self.mean, self.m2 = _merge_moments(self.count, self.mean, self.m2,
+                                                            len(chunk), chunk_mean, chunk_m2)
+        np.minimum(self.min, chunk.min(axis=0), out=self.min)
+        np.maximum(self.max, chunk.max(axis=0), out=self.max)
+        self.passed += np.count_nonzero(chunk >= self.passing_grade, axis=0)
+        for sketch, column in zip(self.sketches, chunk.T):
+            sketch.update(column)
+        return self
+
+    def merge(self, other):
+        """Adds the statistics of another GradeStats over the same exams and passing grade."""
+        if other.num_exams != self.num_exams or other.passing_grade != self.passing_grade:
+            raise ValueError("Cannot merge statistics for different exams or passing grades.")
+        with np.errstate(invalid='ignore', over='ignore'):
+            self.count, self.mean, self.m2 = _merge_moments(self.count, self.mean, self.m2,
+                                                            other.count, other.mean, other.m2)
+        np.minimum(self.min, other.min, out=self.min)
+        np.maximum(self.max, other.max, out=self.max)
+        self.passed += other.passed
+        for sketch, other_sketch in zip(self.sketches, other.sketches):
+            sketch.merge(other_sketch)
+        return self
+
+    @property
+    def failed(self):
+        return self.count - self.passed
+
+    @property
+    def std(self):
+        """Population standard deviation per exam, like np.std."""
+        return np.sqrt(self.m2 / self.count) if self.count else np.full(self.num_exams, np.nan)
+
+    def median(self):
+        return np.array([sketch.median() for sketch in self.sketches])
+
+    def percentile(self, q):
+        """q-th percentile (0-100) per exam."""
+        return np.array([sketch.quantile(q / 100) for sketch in self.sketches])
+
+    def overall(self):
+        """Statistics over all grades combined, as a dictionary."""
+        count, mean, m2 = 0, 0.0, 0.0
+        with np.errstate(invalid='ignore', over='ignore'):
+            for exam in range(self.num_exams):
+                count, mean, m2 = _merge_moments(count, mean, m2, self.count, self.mean[exam], self.m2[exam])
+        sketch = QuantileSketch(self.sketches[0].resolution if self.sketches else 0.01)
+        for exam_sketch in self.sketches:
+            sketch.merge(exam_sketch)
+        passed = int(self.passed.sum())
+        return {
+            "count": count,
+            "mean": mean if count else np.nan,
+            "median": sketch.median(),
+            "std": np.sqrt(m2 / count) if count else np.nan,
+            "min": self.min.min() if count else np.nan,
+            "max": self.max.max() if count else np.nan,
+            "passed": passed,
+            "pass_percentage": passed / count * 100 if count else np.nan,
+        }
+
+
+def compute_grade_stats(chunks, num_exams=None, passing_grade=60, chunk_rows=1 << 16):
+    """Builds a GradeStats from a 2D grades array or an iterable of 2D chunks."""
+    # Arrays are read chunk_rows at a time so a memory-mapped cache streams from disk
+    if isinstance(chunks, np.ndarray):
+        data = chunks
+        num_exams = data.shape[1] if data.ndim == 2 else num_exams
+        chunks = (data[start:start + chunk_rows] for start in range(0, len(data), chunk_rows))
+    stats = None
+    for chunk in chunks:
+        if stats is None:
+            stats = GradeStats(num_exams or chunk.shape[1], passing_grade)
+        stats.update(chunk)
+    return stats if stats is not None else GradeStats(num_exams or 0, passing_grade)
+
+
+def read_exam_names(file_name):
+    """Returns the exam column names from a grades CSV header (every column after the two name columns)."""
+    with open(file_name, mode='r') as file:
+        return _read_grade_header(file)[2:]
+
+
+def _plain(value):
+    """Converts NumPy scalars to Python numbers so reports can go straight to json.dumps."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+class GradeAnalysis:
+    """Lazily evaluated, cached analysis of one grades CSV."""
+
+    def __init__(self, file_name=FILE_NAME, passing_grade=60, dtype=np.float64, use_cache=True):
+        self.file_name = file_name
+        self.passing_grade = passing_grade
+        self.dtype = dtype
+        self.use_cache = use_cache
+        # Results are kept until the file's size or mtime changes, the lock lets server threads share one instance
+        self._lock = threading.RLock()
+        self._signature = None
+        self._clear()
+
+    def _clear(self):
+        self._grades = None
+        self._rejected = None
+        self._exam_names = None
+        self._stats = None
+        self._report = None
+
+    def _check_source(self):
+        # Drops everything computed from an older version of the file
+        source = os.stat(self.file_name)
+        signature = (source.st_size, source.st_mtime_ns)
+        if signature != self._signature:
+            self._clear()
+            self._signature = signature
+
+    def _load(self):
+        if self._grades is None:
+            loader = load_grades_cached if self.use_cache else load_grades
+            self._grades, self._rejected = loader(self.file_name, self.dtype)
+
+    @property
+    def grades(self):
+        """2D array of grades, one row per student and one column per exam."""
+        with self._lock:
+            self._check_source()
+            self._load()
+            return self._grades
+
+    @property
+    def rejected(self):
+        """Line numbers of rows skipped for missing or non-numeric grades."""
+        with self._lock:
+            self._check_source()
+            self._load()
+            return self._rejected
+
+    @property
+    def exam_names(self):
+        with self._lock:
+            self._check_source()
+            if self._exam_names is None:
+                self._exam_names = read_exam_names(self.file_name)
+            return self._exam_names
+
+    @property
+    def stats(self):
+        """GradeStats for the current file and passing grade."""
+        with self._lock:
+            self._check_source()
+            if self._stats is None or self._stats.passing_grade != self.passing_grade:
+                self._load()
+                self._stats = compute_grade_stats(self._grades, len(self.exam_names), self.passing_grade)
+                self._report = None
+            return self._stats
+
+    def report(self):
+        """Returns every result of the printed report as a JSON-ready dictionary."""
+        with self._lock:
+            stats = self.stats
+            if self._report is None:
+                self._report = stats_report(stats, self.exam_names)
+                self._report["file"] = self.file_name
+                self._report["rejected_rows"] = list(self._rejected)
+            # callers get their own copy so editing one report cannot change the cached one
+            return copy.deepcopy(self._report)
+
+
+def stats_report(stats, exam_names):
+    """Turns a GradeStats into a JSON-ready dictionary of per-exam and overall results."""
+    medians = stats.median()
+    exams = []
+    for i, name in enumerate(exam_names):
+        exams.append({
+            "name": name,
+            "mean": _plain(stats.mean[i]),
+            "median": _plain(medians[i]),
+            "std": _plain(stats.std[i]),
+            "min": _plain(stats.min[i]),
+            "max": _plain(stats.max[i]),
+            "passed": _plain(stats.passed[i]),
+            "failed": _plain(stats.failed[i]),
+        })
+    return {
+        "students": stats.count,
+        "exams": exams,
+        "overall": {key: _plain(value) for key, value in stats.overall().items()},
+        "passing_grade": stats.passing_grade,
+    }
 
 
 # Calculate Exam-Specific Statistics
-def calculate_exam_stats(data, exam_names):
+def calculate_exam_stats(data, exam_names, stats=None):
     """Calculates and prints statistical summary for each exam (column)."""
     print("3. Statistics for Each Exam (axis=0)")
     print("---------------------------------------------------------")
 
-    # NumPy calculations along axis=0 (down the rows, for each exam)
-    means = np.mean(data, axis=0)
-    medians = np.median(data, axis=0)
-    stds = np.std(data, axis=0)
-    mins = np.min(data, axis=0)
-    maxs = np.max(data, axis=0)
+    stats = stats if stats is not None else compute_grade_stats(data)
+    rows = [
+        ("Mean (Avg)", stats.mean, ".2f"),
+        ("Median", stats.median(), ".2f"),
+        ("Std Dev", stats.std, ".2f"),
+        ("Minimum", stats.min, ".0f"),
+        ("Maximum", stats.max, ".0f"),
+    ]
 
-    # Print results in a structured format
-    print(f"{'Statistic':<15} | {'Exam 1':<8} | {'Exam 2':<8} | {'Exam 3':<8}")
-    print("-" * 50)
-    print(f"{'Mean (Avg)':<15} | {means[0]:<8.2f} | {means[1]:<8.2f} | {means[2]:<8.2f}")
-    print(f"{'Median':<15} | {medians[0]:<8.2f} | {medians[1]:<8.2f} | {medians[2]:<8.2f}")
-    print(f"{'Std Dev':<15} | {stds[0]:<8.2f} | {stds[1]:<8.2f} | {stds[2]:<8.2f}")
-    print(f"{'Minimum':<15} | {mins[0]:<8.0f} | {mins[1]:<8.0f} | {mins[2]:<8.0f}")
-    print(f"{'Maximum':<15} | {maxs[0]:<8.0f} | {maxs[1]:<8.0f} | {maxs[2]:<8.0f}")
+    # Print results in a structured format, one column per exam
+    print(f"{'Statistic':<15} | " + " | ".join(f"{name:<8}" for name in exam_names))
+    print("-" * (17 + 11 * len(exam_names)))
+    for label, values, spec in rows:
+        print(f"{label:<15} | " + " | ".join(f"{value:<8{spec}}" for value in values))
     print("---------------------------------------------------------")
 
-# Execute Function 1
-calculate_exam_stats(grades_array, exam_names)
-
 
 # Overall Statistics
-print("4. Overall Statistics (All Grades Combined)")
-print("---------------------------------------------------------")
-
-# NumPy calculations on the entire array (treated as one set of data)
-overall_mean = np.mean(grades_array)
-overall_median = np.median(grades_array)
-overall_std = np.std(grades_array)
-overall_min = np.min(grades_array)
-overall_max = np.max(grades_array)
+def print_overall_stats(stats):
+    """Prints the statistics of all grades combined."""
+    print("4. Overall Statistics (All Grades Combined)")
+    print("---------------------------------------------------------")
 
-print(f"Overall Mean Grade: {overall_mean:.2f}")
-print(f"Overall Median Grade: {overall_median:.2f}")
-print(f"Overall Standard Deviation: {overall_std:.2f}")
-print(f"Overall Minimum Grade: {overall_min}")
-print(f"Overall Maximum Grade: {overall_max}")
-print("---------------------------------------------------------")
+    # Overall numbers are combined from the per-exam statistics instead of rescanning the array
+    overall = stats.overall()
+    print(f"Overall Mean Grade: {overall['mean']:.2f}")
+    print(f"Overall Median Grade: {overall['median']:.2f}")
+    print(f"Overall Standard Deviation: {overall['std']:.2f}")
+    print(f"Overall Minimum Grade: {overall['min']}")
+    print(f"Overall Maximum Grade: {overall['max']}")
+    print("---------------------------------------------------------")
 
 
 # Pass/Fail Analysis and Overall Percentage
-def analyze_pass_fail(data, exam_names, passing_grade=60):
+def analyze_pass_fail(data, exam_names, passing_grade=60, stats=None):
 
-    # Use a boolean mask: True if grade >= 60, False otherwise
-    passed_mask = data >= passing_grade
+    # Pass counts come from GradeStats, reused when it was built with the same passing grade
+    if stats is None or stats.passing_grade != passing_grade:
+        stats = compute_grade_stats(data, passing_grade=passing_grade)
 
     # Pass/Fail Counts per Exam
     print(f"5. Pass/Fail Analysis (Passing Grade $\\geq$ {passing_grade})")
     print("---------------------------------------------------------")
 
-    num_passed = np.sum(passed_mask, axis=0)
-    total_students = data.shape[0]
-    num_failed = total_students - num_passed
+    num_passed = stats.passed
+    num_failed = stats.failed
 
     # Print results in a structured format
     print(f"{'Exam':<8} | {'Passed':<8} | {'Failed':<8}")
@@ -120,8 +567,8 @@ def analyze_pass_fail(data, exam_names, passing_grade=60):
     print("6. Overall Pass Percentage")
     print("---------------------------------------------------------")
 
-    total_grades = data.size
-    total_passed = np.sum(passed_mask)
+    total_grades = stats.count * stats.num_exams
+    total_passed = num_passed.sum()
     overall_pass_percentage = (total_passed / total_grades) * 100
 
     print(f"Total Grades Analyzed: {total_grades}")
@@ -129,5 +576,145 @@ def analyze_pass_fail(data, exam_names, passing_grade=60):
     print(f"Overall Pass Percentage: {overall_pass_percentage:.2f}%")
     print("---------------------------------------------------------")
 
-# Execute Function 2
-analyze_pass_fail(grades_array, exam_names)
\ No newline at end of file
+
+def print_report(analysis):
+    """Prints the full report for a GradeAnalysis."""
+    grades_array = analysis.grades
+    for line_number in analysis.rejected:
+        print(f"Skipping row {line_number} due to non-numeric grade data")
+
+    # 2. Print the first few rows of the dataset
+    print("1. Data Loaded Directly from File & 2. First 5 Rows")
+    print("---------------------------------------------------------")
+    print(f"File: {analysis.file_name}")
+    print(f"NumPy Array Shape: {grades_array.shape}")
+    print("\nFirst 5 Rows:")
+    print(grades_array[:5])
+    print("---------------------------------------------------------")
+
+    calculate_exam_stats(grades_array, analysis.exam_names, analysis.stats)
+    print_overall_stats(analysis.stats)
+    analyze_pass_fail(grades_array, analysis.exam_names, analysis.passing_grade, analysis.stats)
+
+
+def _file_grade_stats(file_name, passing_grade):
+    """Worker task: streams one grades file into a GradeStats, returns a small picklable result."""
+    rejected = []
+    try:
+        exam_names = read_exam_names(file_name)
+        stats = compute_grade_stats(iter_grade_chunks(file_name, rejected=rejected), len(exam_names), passing_grade)
+    except (OSError, ValueError) as e:
+        return {"file": file_name, "error": str(e)}
+    return {"file": file_name, "exam_names": tuple(exam_names), "stats": stats, "rejected": len(rejected)}
+
+
+def iter_file_stats(paths, passing_grade=60, workers=None):
+    """Computes GradeStats for many files across a process pool, in the order given."""
+    paths = list(paths)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(paths) < 2:
+        for path in paths:
+            yield _file_grade_stats(path, passing_grade)
+        return
+
+    # A term has thousands of small section files and each result is only a few arrays, so every path is
+    # queued up front and handed out in batches to cut the per-file round trip to the workers
+    batch = max(1, len(paths) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_file_grade_stats, paths, repeat(passing_grade), chunksize=batch)
+
+
+def aggregate_grade_files(paths, passing_grade=60, workers=None, on_result=None):
+    """Merges per-file statistics into totals per set of exam columns, returns (groups, errors)."""
+    groups = {}
+    errors = []
+    for result in iter_file_stats(paths, passing_grade, workers):
+        if on_result is not None:
+            on_result(result)
+        if "error" in result:
+            errors.append((result["file"], result["error"]))
+            continue
+        group = groups.get(result["exam_names"])
+        if group is None:
+            groups[result["exam_names"]] = [result["stats"], 1, result["rejected"]]
+        else:
+            group[0].merge(result["stats"])
+            group[1] += 1
+            group[2] += result["rejected"]
+    return groups, errors
+
+
+def list_grade_files(directory, extensions=(".csv",)):
+    """Grade files under directory (cache sidecars end in .npy/.json and are left out), in path order."""
+    found = []
+    for root, _, names in os.walk(directory):
+        for name in names:
+            if name.lower().endswith(extensions):
+                found.append(os.path.join(root, name))
+    return sorted(found)
+
+
+def batch_main(argv):
+    """Aggregates a directory of grades files, prints the combined report, returns the exit status."""
+    parser = argparse.ArgumentParser(description="Combine the grade statistics of a directory of CSV files")
+    parser.add_argument("directory", help="folder with grades CSV files (searched recursively)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("-p", "--passing-grade", type=float, default=60, help="lowest passing grade")
+    parser.add_argument("--per-file", action="store_true", help="print one line per file as it is processed")
+    parser.add_argument("--json", action="store_true", help="print the combined results as JSON")
+    args = parser.parse_args(argv)
+
+    def show_file(result):
+        if "error" in result:
+            print(f"Error: could not read '{result['file']}': {result['error']}", file=sys.stderr)
+        elif args.per_file:
+            stats = result["stats"]
+            print(f"{result['file']}: {stats.count:,} students, mean {stats.overall()['mean']:.2f}, "
+                  f"{result['rejected']:,} rows skipped", file=sys.stderr)
+
+    paths = list_grade_files(args.directory)
+    started = time.perf_counter()
+    groups, errors = aggregate_grade_files(paths, args.passing_grade, args.workers, show_file)
+    elapsed = time.perf_counter() - started
+
+    if args.json:
+        reports = []
+        for exam_names, (stats, files, rejected) in groups.items():
+            report = stats_report(stats, exam_names)
+            report["files"] = files
+            report["rejected_rows"] = rejected
+            reports.append(report)
+        print(json.dumps({"directory": args.directory, "groups": reports,
+                          "errors": [{"file": name, "error": message} for name, message in errors]}, indent=2))
+    else:
+        for exam_names, (stats, files, rejected) in groups.items():
+            print(f"Files: {files:,}  Students: {stats.count:,}  Rows skipped: {rejected:,}")
+            print("---------------------------------------------------------")
+            calculate_exam_stats(None, exam_names, stats)
+            print_overall_stats(stats)
+            analyze_pass_fail(None, exam_names, args.passing_grade, stats)
+
+    print(f"\nProcessed {len(paths):,} files in {elapsed:.2f}s, {len(errors):,} could not be read", file=sys.stderr)
+    return 1 if errors else 0
+
+
+def main(file_name=FILE_NAME):
+    """Runs the report for one file, returns the process exit status."""
+    analysis = GradeAnalysis(file_name)
+    try:
+        analysis.grades
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    except FileNotFoundError:
+        print(f"Error: The file '{file_name}' was not found.")
+        print("Please ensure the CSV file is in the same directory as this script.")
+        return 1
+    print_report(analysis)
+    return 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and os.path.isdir(sys.argv[1]):
+        sys.exit(batch_main(sys.argv[1:]))
+    sys.exit(main(*sys.argv[1:2]))